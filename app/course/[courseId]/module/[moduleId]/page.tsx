@@ -34,25 +34,16 @@ export default function ModulePlayerPage() {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [courseData, moduleData] = await Promise.all([
-          courseApi.get(courseSlug),
-          courseApi.getModule(courseSlug, moduleSlug),
-        ])
-        setCourse(courseData)
-        setModule(moduleData)
-
-        // Fetch progress if authenticated
-        if (isAuthenticated) {
-          try {
-            const progressData = await progressApi.getCourseProgress(courseSlug)
-            setProgress(progressData)
-            const moduleProgress = progressData.find((p) => p.module_slug === moduleSlug)
-            if (moduleProgress?.completed) {
-              setIsCompleted(true)
-            }
-          } catch {
-            // Ignore progress errors
-          }
+        // Course outline, module content and progress in one round trip
+        const bundle = await courseApi.getBundle(courseSlug, moduleSlug)
+        setCourse(bundle.course)
+        setModule(bundle.module)
+        setProgress(bundle.progress)
+        const moduleProgress = bundle.progress.find((p) => p.module_slug === moduleSlug)
+        if (moduleProgress?.completed) {
+          setIsCompleted(true)
+          const saved = await progressApi.getReflectionAnswers(courseSlug, moduleSlug)
+          setAnswers(saved.answers)
         }
       } catch (error) {
         console.error("Failed to fetch module:", error)
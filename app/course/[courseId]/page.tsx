@@ -9,7 +9,7 @@ import { Navbar } from "@/components/navbar"
 import { Footer } from "@/components/footer"
 import { ModuleCard } from "@/components/module-card"
 import { Skeleton } from "@/components/ui/skeleton"
-import { courseApi, progressApi, type CourseDetail, type UserProgress } from "@/lib/api"
+import { courseApi, type CourseDetail, type UserProgress } from "@/lib/api"
 import { useAuth } from "@/lib/auth-context"
 import { useEffect, useState } from "react"
 import { cn } from "@/lib/utils"
@@ -51,18 +51,10 @@ export default function CourseDetailPage() {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const courseData = await courseApi.get(courseSlug)
-        setCourse(courseData)
-
-        // Fetch progress if authenticated
-        if (isAuthenticated) {
-          try {
-            const progressData = await progressApi.getCourseProgress(courseSlug)
-            setProgress(progressData)
-          } catch {
-            // Ignore progress errors
-          }
-        }
+        // Course outline and progress in one round trip
+        const bundle = await courseApi.getBundle(courseSlug)
+        setCourse(bundle.course)
+        setProgress(bundle.progress)
       } catch (error) {
         console.error("Failed to fetch course:", error)
         setNotFoundError(true)
@@ -81,7 +81,64 @@ export interface UserProgress {
   course_slug: string
   completed: boolean
   completed_at: string | null
-  reflection_answers: Record<string, string>
+  // Only present when requested with ?include=reflection_answers
+  reflection_answers?: Record<string, string>
+}
+
+export interface ModuleReflectionAnswers {
+  course: string
+  module: string
+  answers: Record<string, string>
+}
+
+export interface ModuleUnlockState {
+  slug: string
+  order: number
+  state: "completed" | "unlocked" | "locked"
+}
+
+export interface CourseUnlockMap {
+  course: string
+  modules: ModuleUnlockState[]
+}
+
+export interface CourseBundle {
+  course: CourseDetail
+  module: ModuleDetail | null
+  progress: UserProgress[]
+  unlock_map: CourseUnlockMap
+}
+
+export interface CoursePackInfo {
+  course: string
+  title: string
+  content_updated_at: string
+  size: number
+  sha256: string
+  url: string
+}
+
+export interface CoursePackManifest {
+  format: number
+  packs: CoursePackInfo[]
+}
+
+export type ContentChangeType = "course" | "module" | "section" | "point" | "example" | "question"
+
+export type ContentChange =
+  | { type: ContentChangeType; id: number; op: "upsert"; data: Record<string, unknown> }
+  | { type: ContentChangeType; id: number; op: "delete" }
+
+export interface ContentChanges {
+  reset: boolean
+  cursor: number
+  has_more: boolean
+  changes: ContentChange[]
+}
+
+export interface Page<T> {
+  next: string | null
+  results: T[]
 }
 
 export interface AuthResponse {
@@ -115,10 +172,24 @@ async function apiFetch<T>(endpoint: string, options: RequestInit = {}): Promise
   return response.json()
 }
 
+// Fetch every page of a list endpoint, following `next` until it is null
+async function fetchAllPages<T>(endpoint: string): Promise<T[]> {
+  const path = endpoint.split("?")[0]
+  const results: T[] = []
+  let next: string | null = endpoint
+  while (next) {
+    const page: Page<T> = await apiFetch<Page<T>>(next)
+    results.push(...page.results)
+    // `next` is an absolute URL on the same endpoint; keep only its query string
+    next = page.next ? `${path}${new URL(page.next).search}` : null
+  }
+  return results
+}
+
 // Course API
 export const courseApi = {
   // Get all courses
-  list: () => apiFetch<CourseListItem[]>("/courses/"),
+  list: () => fetchAllPages<CourseListItem>("/courses/"),
 
   // Get course detail with modules
   get: (slug: string) => apiFetch<CourseDetail>(`/courses/${slug}/`),
@@ -126,6 +197,19 @@ export const courseApi = {
   // Get module detail with content
   getModule: (courseSlug: string, moduleSlug: string) =>
     apiFetch<ModuleDetail>(`/courses/${courseSlug}/modules/${moduleSlug}/`),
+
+  // Get the course outline, a module's content, progress and unlock map in one request
+  getBundle: (courseSlug: string, moduleSlug?: string) =>
+    apiFetch<CourseBundle>(
+      `/courses/${courseSlug}/bundle/${moduleSlug ? `?module=${encodeURIComponent(moduleSlug)}` : ""}`,
+    ),
+
+  // List the offline packs; download one from its `url` (gzip-compressed JSON)
+  getPacks: () => apiFetch<CoursePackManifest>("/packs/"),
+
+  // Content rows changed since a sync cursor; omit it to get the current cursor
+  getChanges: (since?: number) =>
+    apiFetch<ContentChanges>(`/content/changes/${since === undefined ? "" : `?since=${since}`}`),
 }
 
 // Auth API
@@ -166,11 +250,11 @@ export const authApi = {
 // Progress API
 export const progressApi = {
   // Get all user progress
-  list: () => apiFetch<UserProgress[]>("/progress/"),
+  list: () => fetchAllPages<UserProgress>("/progress/"),
 
   // Get progress for a specific course
   getCourseProgress: (courseSlug: string) =>
-    apiFetch<UserProgress[]>(`/progress/course_progress/?course=${courseSlug}`),
+    fetchAllPages<UserProgress>(`/progress/course_progress/?course=${courseSlug}`),
 
   // Complete a module
   completeModule: (courseSlug: string, moduleSlug: string, reflectionAnswers: Record<string, string> = {}) =>
@@ -183,6 +267,16 @@ export const progressApi = {
       }),
     }),
 
+  // Get the user's reflection answers for a module, keyed by question position
+  getReflectionAnswers: (courseSlug: string, moduleSlug: string) =>
+    apiFetch<ModuleReflectionAnswers>(
+      `/progress/reflection_answers/?course=${courseSlug}&module=${moduleSlug}`,
+    ),
+
+  // Get the lock state of every module in a course
+  getUnlockMap: (courseSlug: string) =>
+    apiFetch<CourseUnlockMap>(`/progress/unlock_map/?course=${courseSlug}`),
+
   // Check if module is unlocked
   isModuleUnlocked: (courseSlug: string, moduleSlug: string) =>
     apiFetch<{ unlocked: boolean }>(`/progress/is_module_unlocked/?course=${courseSlug}&module=${moduleSlug}`),
@@ -0,0 +1,125 @@
+"""Database configuration, primary/replica routing and SQLite tuning."""
+from contextvars import ContextVar
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+ENGINES = {
+    'sqlite': 'django.db.backends.sqlite3',
+    'postgres': 'django.db.backends.postgresql',
+    'postgresql': 'django.db.backends.postgresql',
+    'pgsql': 'django.db.backends.postgresql',
+    'mysql': 'django.db.backends.mysql',
+}
+
+# Models that are only written by content loads and the admin; reads of
+# these may be served by the replica.
+REPLICA_READ_APPS = {'courses'}
+PRIMARY_ONLY_MODELS = {
+    'courses.userprogress',
+    'courses.progresssyncoperation',
+    'courses.coursecompletion',
+    'courses.reflectionanswer',
+    'courses.modulefunnel',
+    'courses.moduledailyfunnel',
+}
+
+# True while serving a request that has not written yet. Management
+# commands and shells never set it, so they always use the primary.
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def database_config(url, conn_max_age=0, sqlite_timeout=5):
+    """Build a DATABASES entry from a URL such as ``postgres://u:p@host/db``.
+
+    ``sqlite:///db.sqlite3`` is relative to the working directory,
+    ``sqlite:////var/db/app.sqlite3`` is absolute.
+    """
+    parts = urlsplit(url)
+    try:
+        engine = ENGINES[parts.scheme]
+    except KeyError:
+        raise ValueError(f'Unsupported database URL scheme: {parts.scheme!r}')
+    options = dict(parse_qsl(parts.query))
+    config = {
+        'ENGINE': engine,
+        'CONN_MAX_AGE': conn_max_age,
+        'CONN_HEALTH_CHECKS': conn_max_age > 0,
+    }
+    if engine == ENGINES['sqlite']:
+        config['NAME'] = unquote(parts.path[1:]) or ':memory:'
+        options['timeout'] = float(options.get('timeout', sqlite_timeout))
+    else:
+        config.update({
+            'NAME': unquote(parts.path[1:]),
+            'USER': unquote(parts.username or ''),
+            'PASSWORD': unquote(parts.password or ''),
+            'HOST': parts.hostname or '',
+            'PORT': str(parts.port or ''),
+        })
+    config['OPTIONS'] = options
+    return config
+
+
+def reads_from_replica(model):
+    meta = model._meta
+    return meta.app_label in REPLICA_READ_APPS and meta.label_lower not in PRIMARY_ONLY_MODELS
+
+
+class PrimaryReplicaRouter:
+    """Send catalog reads to ``replica`` and everything else to ``default``.
+
+    Replica reads only happen inside a request (see
+    ReplicaPinningMiddleware). Once that request writes to the primary, the
+    rest of it reads from the primary too so it sees its own writes.
+
+    Routing is per model: a catalog queryset that joins or subqueries a
+    ``PRIMARY_ONLY_MODELS`` table must be pinned with ``.using('default')``.
+    """
+    replica = 'replica'
+
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get() and self.replica in settings.DATABASES and reads_from_replica(model):
+            return self.replica
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        _replica_reads.set(False)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {'default', self.replica}
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+
+class ReplicaPinningMiddleware:
+    """Scope read-your-writes pinning to a single request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _replica_reads.set(True)
+        try:
+            return self.get_response(request)
+        finally:
+            _replica_reads.reset(token)
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Use WAL so readers don't block the writer, and wait instead of failing on locks."""
+    if connection.vendor != 'sqlite':
+        return
+    timeout_ms = int(float(connection.settings_dict['OPTIONS'].get('timeout', 5)) * 1000)
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={timeout_ms}')
+        if connection.alias == PrimaryReplicaRouter.replica:
+            cursor.execute('PRAGMA query_only=ON')
+
+
+connection_created.connect(configure_sqlite, dispatch_uid='bfpa_backend.db.configure_sqlite')
@@ -0,0 +1,218 @@
+"""Sparse fieldsets: ``?fields=`` and ``?omit=`` on every output serializer.
+
+Both take comma-separated field names; dotted names reach into nested
+serializers (``?fields=title,modules.slug``, ``?omit=modules.objective``).
+``SparseFieldsMixin`` trims each serializer's fields accordingly, and
+``sparse_queryset`` defers the columns the trimmed serializer will not
+read, including through ``select_related`` joins and ``Prefetch``
+querysets, so unrequested text columns never leave the database.
+
+Fields whose columns are not obvious from their ``source`` (method fields,
+model properties) keep every column of their model loaded unless the
+serializer lists what they read in ``Meta.field_columns``.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+def parse_fieldset(value):
+    """Parse ``a,b.c`` into the nested dict ``{'a': {}, 'b': {'c': {}}}``."""
+    if not value:
+        return None
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for part in path.strip().split('.'):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def subtree(tree, path):
+    for part in path:
+        if not tree:
+            return tree
+        tree = tree.get(part)
+    return tree
+
+
+def fieldset_key(request):
+    """The requested fieldset, for cache keys and ETags."""
+    params = request.query_params
+    return params.get('fields', ''), params.get('omit', '')
+
+
+class SparseFieldsMixin:
+    """Drop the fields a request's ``?fields=``/``?omit=`` leave out.
+
+    Only applies to serializers rendering output with a request in their
+    context; serializers validating input are never trimmed. Naming a field
+    the serializer does not render raises a ValidationError (400) listing
+    the fields it does.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        only, omit = self.requested_fieldset()
+        for param, tree in (('fields', only), ('omit', omit)):
+            if tree:
+                check_fieldset(param, tree, fields, self.field_path())
+        if only:
+            fields = {name: field for name, field in fields.items() if name in only}
+        if omit:
+            fields = {name: field for name, field in fields.items() if omit.get(name) != {}}
+        return fields
+
+    def requested_fieldset(self):
+        """Return the ``(only, omit)`` trees that apply at this serializer's depth."""
+        root = self.root
+        request = root.context.get('request')
+        if request is None or hasattr(root, 'initial_data'):
+            return None, None
+        trees = getattr(root, '_fieldset_trees', None)
+        if trees is None:
+            params = request.query_params
+            trees = root._fieldset_trees = (parse_fieldset(params.get('fields')), parse_fieldset(params.get('omit')))
+        path = self.field_path()
+        return subtree(trees[0], path), subtree(trees[1], path)
+
+    def field_path(self):
+        """Field names from the root serializer down to this one."""
+        path, node = [], self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+        path.reverse()
+        return path
+
+
+def check_fieldset(param, tree, fields, path):
+    """Reject names in ``tree`` that are not readable fields of ``fields``."""
+    allowed = [name for name, field in fields.items() if not field.write_only]
+    unknown = [name for name in tree if name not in allowed]
+    if unknown:
+        prefix = ''.join(f'{part}.' for part in path)
+        raise ValidationError({param: [
+            f"Unknown field{'s' if len(unknown) > 1 else ''} {', '.join(prefix + name for name in unknown)}. "
+            f"Allowed fields: {', '.join(prefix + name for name in allowed)}."
+        ]})
+
+
+def sparse_queryset(queryset, serializer, keep=()):
+    """Defer the columns ``serializer`` will not render.
+
+    ``keep`` names extra columns the caller reads itself (e.g. the
+    pagination key). Returns ``queryset`` unchanged unless the request
+    asked for a fieldset.
+    """
+    serializer = getattr(serializer, 'child', serializer)
+    request = serializer.context.get('request')
+    if request is None or not any(fieldset_key(request)):
+        return queryset
+    return prune_queryset(queryset, serializer, keep)
+
+
+def prune_queryset(queryset, serializer, keep=()):
+    """Defer unrendered columns and drop prefetches of unrendered relations."""
+    needed, unknown, nested = {(): set(keep)}, set(), {}
+    collect_columns(serializer, queryset.query.select_related, (), needed, unknown, nested)
+
+    deferred = []
+    for path, names in needed.items():
+        if any(path[:depth] in unknown for depth in range(len(path) + 1)):
+            continue
+        model = queryset.model
+        for part in path:
+            model = model._meta.get_field(part).related_model
+        deferred += [
+            '__'.join(path + (field.name,))
+            for field in model._meta.concrete_fields
+            if not field.primary_key and not field.is_relation and field.name not in names
+        ]
+    if deferred:
+        queryset = queryset.defer(*deferred)
+
+    lookups = []
+    for lookup in queryset._prefetch_related_lookups:
+        to = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        name = to.split('__')[0]
+        if name in nested and nested[name] is None:
+            continue  # the field was left out, so skip the query
+        if isinstance(lookup, Prefetch) and to == name and name in nested and lookup.queryset is not None:
+            lookup = Prefetch(
+                lookup.prefetch_through,
+                queryset=prune_queryset(lookup.queryset, nested[name]),
+                to_attr=lookup.to_attr,
+            )
+        lookups.append(lookup)
+    return queryset.prefetch_related(None).prefetch_related(*lookups)
+
+
+def collect_columns(serializer, select_related, path, needed, unknown, nested):
+    """Record the columns ``serializer`` reads, per relation path from the queryset's model.
+
+    Paths whose columns cannot be worked out are added to ``unknown`` and
+    left alone. At the top level, ``nested`` maps each reverse relation to
+    the serializer rendering it, or ``None`` when nothing does.
+    """
+    model = serializer.Meta.model
+    declared = getattr(serializer.Meta, 'field_columns', {})
+    names = needed.setdefault(path, set())
+    for sub in joined_paths(select_related, path):
+        needed.setdefault(sub, set())
+    if not path:
+        nested.update(dict.fromkeys(reverse_relations(model)))
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in declared:
+            names.update(declared[name])
+            continue
+        attrs = field.source_attrs
+        if not attrs or not is_field(model, attrs[0]):
+            unknown.add(path)
+            continue
+        names.add(attrs[0])
+        child = field.child if isinstance(field, ListSerializer) else field
+        if isinstance(child, BaseSerializer):
+            joined = select_related.get(attrs[0]) if isinstance(select_related, dict) else None
+            if joined is not None:
+                collect_columns(child, joined, path + (attrs[0],), needed, unknown, nested)
+                if not path:
+                    nested.pop(attrs[0], None)
+            elif not path:
+                nested[attrs[0]] = child
+            continue
+        # A dotted source such as ``module.course.slug`` read over joined tables.
+        related, sub, node = model, path, select_related
+        for attr, following in zip(attrs, attrs[1:]):
+            if not isinstance(node, dict) or attr not in node:
+                break
+            related, sub, node = related._meta.get_field(attr).related_model, sub + (attr,), node[attr]
+            if not is_field(related, following):
+                unknown.add(sub)
+                break
+            needed[sub].add(following)
+
+
+def joined_paths(select_related, path):
+    if isinstance(select_related, dict):
+        for name, below in select_related.items():
+            yield path + (name,)
+            yield from joined_paths(below, path + (name,))
+
+
+def is_field(model, name):
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def reverse_relations(model):
+    return [field.name for field in model._meta.get_fields() if field.auto_created and not field.concrete]
@@ -0,0 +1,323 @@
+"""HTTP load test harness for the API.
+
+Runs the real WSGI application in a threaded server against a throwaway
+database seeded from the content bundle, then drives concurrent virtual
+users through browse, login, read and complete flows. Every response
+carries the number of SQL queries it ran so per-endpoint query counts can
+be reported alongside latency percentiles and throughput.
+"""
+import http.client
+import io
+import json
+import platform
+import random
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+
+from courses.models import Module
+from users.models import UserProfile
+
+QUERY_COUNT_HEADER = 'X-Query-Count'
+PASSWORD = 'load-test-password'
+# Attempts per login while the password hashing pool answers 503.
+LOGIN_ATTEMPTS = 20
+
+# Relative weight of each flow when a virtual user picks its next one.
+FLOW_WEIGHTS = {'browse': 4, 'read_module': 3, 'complete_module': 2, 'login': 1}
+
+
+class LoadTestError(Exception):
+    pass
+
+
+class QueryCountingApp:
+    """WSGI wrapper that reports the queries each request ran in a header.
+
+    Queries the password hashing pool runs for a login count too.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def __call__(self, environ, start_response):
+        count = 0
+
+        def counter(execute, sql, params, many, context):
+            nonlocal count
+            count += 1
+            return execute(sql, params, many, context)
+
+        def counted_start_response(status, headers, exc_info=None):
+            return start_response(status, headers + [(QUERY_COUNT_HEADER, str(count))], exc_info)
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(counter))
+            return self.app(environ, counted_start_response)
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # keep-alive response waits on the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+def percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class Recorder:
+    """Collects per-endpoint samples from every virtual user."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+
+    def add(self, label, seconds, status, queries):
+        with self.lock:
+            self.samples.setdefault(label, []).append((seconds, status, queries))
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for label, samples in sorted(self.samples.items()):
+            endpoints[label] = summarize(samples, elapsed)
+        everything = [sample for samples in self.samples.values() for sample in samples]
+        return summarize(everything, elapsed), endpoints
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(seconds * 1000 for seconds, _, _ in samples)
+    queries = [queries for _, _, queries in samples if queries is not None]
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for _, status, _ in samples if status >= 400),
+        'rps': round(len(samples) / elapsed, 2) if elapsed else None,
+        'latency_ms': {
+            'mean': round(sum(latencies) / len(latencies), 3) if latencies else None,
+            'p50': round(percentile(latencies, 50), 3) if latencies else None,
+            'p95': round(percentile(latencies, 95), 3) if latencies else None,
+            'p99': round(percentile(latencies, 99), 3) if latencies else None,
+            'max': round(latencies[-1], 3) if latencies else None,
+        },
+        'queries_per_request': {
+            'mean': round(sum(queries) / len(queries), 2) if queries else None,
+            'max': max(queries) if queries else None,
+        },
+    }
+
+
+class VirtualUser:
+    """One simulated learner with its own connection and random stream."""
+
+    def __init__(self, host, port, username, modules, seed, recorder):
+        self.conn = http.client.HTTPConnection(host, port, timeout=30)
+        self.username = username
+        self.modules = modules
+        self.courses = sorted({course for course, _ in modules})
+        self.random = random.Random(seed)
+        self.recorder = recorder
+        self.token = None
+        self.retry_after = None
+        self.error = None
+
+    def request(self, method, path, label, body=None, record=True):
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Token {self.token}'
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        start = time.perf_counter()
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            payload = response.read()
+            status = response.status
+            queries = response.getheader(QUERY_COUNT_HEADER)
+            self.retry_after = response.getheader('Retry-After')
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            payload, status, queries = b'', 599, None
+            self.retry_after = None
+        if record:
+            self.recorder.add(
+                f'{method} {label}', time.perf_counter() - start, status,
+                int(queries) if queries is not None else None,
+            )
+        return status, payload
+
+    def login(self, record=True):
+        """Log in, waiting out the hashing pool's 503s as a real client would.
+
+        Each attempt is recorded, so the 503s show up as errors.
+        """
+        for _ in range(LOGIN_ATTEMPTS):
+            status, payload = self.request(
+                'POST', '/api/auth/login/', '/api/auth/login/',
+                {'username': self.username, 'password': PASSWORD}, record,
+            )
+            if status != 503:
+                break
+            # Jitter from the global generator keeps the seeded flow sequence intact.
+            time.sleep(float(self.retry_after or 1) * random.uniform(1, 2))
+        if status == 200:
+            self.token = json.loads(payload)['token']
+        return status
+
+    def browse(self, record=True):
+        course = self.random.choice(self.courses)
+        self.request('GET', '/api/courses/', '/api/courses/', record=record)
+        self.request('GET', f'/api/courses/{course}/', '/api/courses/{slug}/', record=record)
+        self.request('GET', f'/api/courses/{course}/modules/', '/api/courses/{slug}/modules/', record=record)
+
+    def read_module(self, record=True):
+        course, module = self.random.choice(self.modules)
+        self.request(
+            'GET', f'/api/courses/{course}/modules/{module}/',
+            '/api/courses/{slug}/modules/{slug}/', record=record,
+        )
+
+    def complete_module(self, record=True):
+        course, module = self.random.choice(self.modules)
+        self.request(
+            'POST', '/api/progress/complete_module/', '/api/progress/complete_module/',
+            {'course_slug': course, 'module_slug': module, 'reflection_answers': {}}, record,
+        )
+        self.request(
+            'GET', f'/api/progress/course_progress/?course={course}',
+            '/api/progress/course_progress/', record=record,
+        )
+        self.request(
+            'GET', f'/api/progress/unlock_map/?course={course}',
+            '/api/progress/unlock_map/', record=record,
+        )
+
+    def relogin(self, record=True):
+        self.login(record)
+        self.request('GET', '/api/auth/me/', '/api/auth/me/', record=record)
+
+    def run(self, iterations, warmup):
+        status = self.login()
+        if self.token is None:
+            self.error = f'{self.username} could not log in (HTTP {status})'
+            self.conn.close()
+            return
+        flows = {
+            'browse': self.browse,
+            'read_module': self.read_module,
+            'complete_module': self.complete_module,
+            'login': self.relogin,
+        }
+        names = list(FLOW_WEIGHTS)
+        weights = [FLOW_WEIGHTS[name] for name in names]
+        for i in range(warmup + iterations):
+            flows[self.random.choices(names, weights)[0]](record=i >= warmup)
+        self.conn.close()
+
+
+def seed(bundle, users):
+    """Load course content and create ``users`` learners sharing one password."""
+    call_command('load_content', str(bundle), stdout=io.StringIO())
+    password = make_password(PASSWORD)
+    accounts = User.objects.bulk_create(
+        User(username=f'loadtest-{n}', email=f'loadtest-{n}@example.com', password=password)
+        for n in range(users)
+    )
+    if not all(account.pk for account in accounts):
+        accounts = list(User.objects.filter(username__startswith='loadtest-').order_by('pk'))
+    UserProfile.objects.bulk_create(UserProfile(user=account) for account in accounts)
+    return [account.username for account in accounts]
+
+
+def run_load_test(users=10, iterations=25, warmup=2, seed_value=0, bundle=None):
+    """Run the benchmark and return the results as a JSON-serializable dict.
+
+    Raises LoadTestError when a virtual user cannot log in.
+    """
+    bundle = Path(bundle or settings.BASE_DIR / 'content' / 'courses.json')
+    settings.DEBUG = False
+    with tempfile.TemporaryDirectory() as workdir, ExitStack() as stack:
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = str(Path(workdir) / 'loadtest.sqlite3')
+        old_config = setup_databases(
+            verbosity=0, interactive=False, aliases=set(connections), serialized_aliases=set(),
+        )
+        stack.callback(teardown_databases, old_config, verbosity=0)
+
+        usernames = seed(bundle, users)
+        modules = list(
+            Module.objects.filter(is_published=True, course__is_published=True)
+            .order_by('course__order', 'order', 'id')
+            .values_list('course__slug', 'slug')
+        )
+        server = ThreadedWSGIServer(('127.0.0.1', 0), QuietRequestHandler, allow_reuse_address=False)
+        server.set_app(QueryCountingApp(get_wsgi_application()))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        stack.callback(server.server_close)
+        stack.callback(server.shutdown)
+        host, port = server.server_address
+
+        recorder = Recorder()
+        virtual_users = [
+            VirtualUser(host, port, username, modules, seed_value + n, recorder)
+            for n, username in enumerate(usernames)
+        ]
+        workers = [
+            threading.Thread(target=virtual_user.run, args=(iterations, warmup))
+            for virtual_user in virtual_users
+        ]
+        started_at = timezone.now()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+    failed = [virtual_user.error for virtual_user in virtual_users if virtual_user.error]
+    if failed:
+        # Flows without a token only time 401s, so the numbers would mislead.
+        raise LoadTestError(f'{len(failed)} of {users} virtual users failed to log in: {failed[0]}')
+
+    totals, endpoints = recorder.summary(elapsed)
+    return {
+        'started_at': started_at.isoformat(),
+        'config': {
+            'users': users,
+            'iterations': iterations,
+            'warmup': warmup,
+            'seed': seed_value,
+            'bundle': bundle.name,
+            'flow_weights': FLOW_WEIGHTS,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'platform': platform.platform(),
+        },
+        'duration_s': round(elapsed, 3),
+        'totals': totals,
+        'endpoints': endpoints,
+    }
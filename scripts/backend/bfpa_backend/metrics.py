@@ -0,0 +1,263 @@
+"""Per-request timing, Server-Timing headers and Prometheus metrics.
+
+``RequestMetricsMiddleware`` measures each request's SQL (count and time),
+view, serializer and renderer time and response size. It reports them in
+a ``Server-Timing`` header and adds them to in-process per-route counters
+and latency histograms, served in Prometheus text format at
+``/api/metrics/``. Counters are per process, so scrape every worker (or
+sum across them).
+
+Instrumentation is a few ``perf_counter()`` calls per request and per
+query plus one short lock to update the counters.
+"""
+import threading
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import BasePermission, IsAdminUser
+from rest_framework.serializers import BaseSerializer
+
+from users.hashing import hashing_pool
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """Time and query totals for the request being served."""
+    __slots__ = ('queries', 'db', 'serialize', 'serializing', 'view_started', 'view_finished')
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.serializing = False
+        self.view_started = None
+        self.view_finished = None
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute wrapper."""
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += perf_counter() - start
+            self.queries += 1
+
+
+def instrument_serializers():
+    """Time top-level ``serializer.data`` calls into the current request's timings.
+
+    Nested serializers run inside their parent's ``to_representation`` and
+    are not counted twice. Serializer time includes any queries that lazy
+    querysets run while serializing.
+    """
+    original = BaseSerializer.data
+    if getattr(original.fget, 'timed', False):
+        return
+
+    def data(self):
+        timings = _current.get()
+        if timings is None or timings.serializing:
+            return original.fget(self)
+        timings.serializing = True
+        start = perf_counter()
+        try:
+            return original.fget(self)
+        finally:
+            timings.serialize += perf_counter() - start
+            timings.serializing = False
+
+    data.timed = True
+    BaseSerializer.data = property(data)
+
+
+class RouteMetrics:
+    __slots__ = ('statuses', 'buckets', 'count', 'seconds', 'queries', 'db', 'serialize', 'render', 'bytes')
+
+    def __init__(self):
+        self.statuses = {}
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.render = 0.0
+        self.bytes = 0
+
+
+class MetricsRegistry:
+    """Thread-safe per-route request counters and latency histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def observe(self, method, route, status, seconds, timings, render, size):
+        index = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = RouteMetrics()
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            if index < len(LATENCY_BUCKETS):
+                metrics.buckets[index] += 1
+            metrics.count += 1
+            metrics.seconds += seconds
+            metrics.queries += timings.queries
+            metrics.db += timings.db
+            metrics.serialize += timings.serialize
+            metrics.render += render
+            metrics.bytes += size
+
+    def snapshot(self):
+        """Copy of the per-route metrics, keyed by ``(method, route)``."""
+        with self._lock:
+            routes = {}
+            for key, metrics in sorted(self._routes.items()):
+                copy = routes[key] = RouteMetrics()
+                for name in RouteMetrics.__slots__:
+                    setattr(copy, name, getattr(metrics, name))
+                copy.statuses = dict(metrics.statuses)
+                copy.buckets = list(metrics.buckets)
+            return routes
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format."""
+        routes = [(labels(method=method, route=route), metrics) for (method, route), metrics in self.snapshot().items()]
+        lines = [
+            '# HELP bfpa_http_requests_total Requests served, by route and status.',
+            '# TYPE bfpa_http_requests_total counter',
+        ]
+        for label, metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f'bfpa_http_requests_total{{{label},status="{status}"}} {count}')
+
+        lines += [
+            '# HELP bfpa_http_request_duration_seconds Request latency, by route.',
+            '# TYPE bfpa_http_request_duration_seconds histogram',
+        ]
+        for label, metrics in routes:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                cumulative += count
+                lines.append(f'bfpa_http_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'bfpa_http_request_duration_seconds_bucket{{{label},le="+Inf"}} {metrics.count}')
+            lines.append(f'bfpa_http_request_duration_seconds_sum{{{label}}} {metrics.seconds:.6f}')
+            lines.append(f'bfpa_http_request_duration_seconds_count{{{label}}} {metrics.count}')
+
+        totals = (
+            ('db_queries_total', 'SQL queries run', 'queries'),
+            ('db_seconds_total', 'Time spent in SQL', 'db'),
+            ('serialize_seconds_total', 'Time spent in serializers', 'serialize'),
+            ('render_seconds_total', 'Time spent rendering responses', 'render'),
+            ('response_bytes_total', 'Response body bytes', 'bytes'),
+        )
+        for name, description, attr in totals:
+            lines += [
+                f'# HELP bfpa_http_{name} {description}, by route.',
+                f'# TYPE bfpa_http_{name} counter',
+            ]
+            for label, metrics in routes:
+                value = getattr(metrics, attr)
+                value = f'{value:.6f}' if isinstance(value, float) else value
+                lines.append(f'bfpa_http_{name}{{{label}}} {value}')
+
+        pool = hashing_pool.stats()
+        for key, kind in (('running', 'gauge'), ('queued', 'gauge'), ('completed', 'counter'), ('rejected', 'counter')):
+            name = f'bfpa_password_hashing_{key}' + ('_total' if kind == 'counter' else '')
+            lines += [
+                f'# HELP {name} Password hashing pool jobs {key}.',
+                f'# TYPE {name} {kind}',
+                f'{name} {pool[key]}',
+            ]
+        return '\n'.join(lines) + '\n'
+
+
+def labels(**values):
+    """Format Prometheus label pairs, escaping backslashes and quotes."""
+    return ','.join(
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for key, value in values.items()
+    )
+
+
+registry = MetricsRegistry()
+
+
+class RequestMetricsMiddleware:
+    """Record per-request timings; add a Server-Timing header and update ``registry``."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        instrument_serializers()
+
+    def __call__(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(timings))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        finished = perf_counter()
+
+        if timings.view_started is None:
+            view = render = 0.0
+        elif timings.view_finished is None:
+            view, render = finished - timings.view_started, 0.0
+        else:
+            view, render = timings.view_finished - timings.view_started, finished - timings.view_finished
+        size = 0 if response.streaming else len(response.content)
+
+        if getattr(settings, 'SERVER_TIMING', True):
+            response['Server-Timing'] = ', '.join((
+                f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"',
+                f'view;dur={view * 1000:.1f}',
+                f'serialize;dur={timings.serialize * 1000:.1f}',
+                f'render;dur={render * 1000:.1f}',
+                f'size;desc="{size} bytes"',
+                f'total;dur={(finished - start) * 1000:.1f}',
+            ))
+        match = request.resolver_match
+        route = match.view_name if match else 'unmatched'
+        registry.observe(request.method, route, response.status_code, finished - start, timings, render, size)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _current.get()
+        if timings is not None:
+            timings.view_started = perf_counter()
+
+    def process_template_response(self, request, response):
+        # Called after the view returns and before the (DRF) response renders.
+        timings = _current.get()
+        if timings is not None:
+            timings.view_finished = perf_counter()
+        return response
+
+
+class HasMetricsToken(BasePermission):
+    """Allow ``Authorization: Bearer <METRICS_TOKEN>`` when a token is configured."""
+
+    def has_permission(self, request, view):
+        token = getattr(settings, 'METRICS_TOKEN', None)
+        return bool(token) and request.META.get('HTTP_AUTHORIZATION') == f'Bearer {token}'
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser | HasMetricsToken])
+def metrics(request):
+    """Serve request metrics in the Prometheus text format."""
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,8 +1,11 @@
 """
 Django settings for BFPA Backend project.
 """
+import os
 from pathlib import Path
 
+from .db import database_config
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = 'django-insecure-bfpa-dev-key-change-in-production'
@@ -26,7 +29,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'bfpa_backend.metrics.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'bfpa_backend.db.ReplicaPinningMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -56,12 +61,21 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'bfpa_backend.wsgi.application'
 
+# Databases come from DATABASE_URL / DATABASE_REPLICA_URL; see bfpa_backend/db.py
+DATABASE_CONN_MAX_AGE = int(os.environ.get('DATABASE_CONN_MAX_AGE', 60))
+SQLITE_BUSY_TIMEOUT = float(os.environ.get('SQLITE_BUSY_TIMEOUT', 5))
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(
+        os.environ.get('DATABASE_URL', f'sqlite:///{BASE_DIR / "db.sqlite3"}'),
+        DATABASE_CONN_MAX_AGE, SQLITE_BUSY_TIMEOUT,
+    ),
 }
+if os.environ.get('DATABASE_REPLICA_URL'):
+    DATABASES['replica'] = database_config(
+        os.environ['DATABASE_REPLICA_URL'], DATABASE_CONN_MAX_AGE, SQLITE_BUSY_TIMEOUT,
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+DATABASE_ROUTERS = ['bfpa_backend.db.PrimaryReplicaRouter']
 
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -85,10 +99,73 @@ CORS_ALLOW_ALL_ORIGINS = True  # For development only
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'users.authentication.SignedTokenAuthentication',
         'rest_framework.authentication.TokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'courses.pagination.KeysetPagination',
+    'PAGE_SIZE': 100,
+    'DEFAULT_RENDERER_CLASSES': [
+        'bfpa_backend.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'bfpa_backend.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
+
+# Largest page a client may request with ?limit=
+API_MAX_PAGE_SIZE = 500
+
+# Upper bound on memory used by the pre-rendered course content cache
+CONTENT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Cache-Control directives sent with course content responses
+CONTENT_CACHE_CONTROL = {
+    'max_age': 60,
+    'stale_while_revalidate': 24 * 60 * 60,
+}
+
+# Serve catalog module counts from Course.published_module_count instead of
+# a COUNT annotation (run `manage.py recompute_module_counts` before enabling)
+USE_DENORMALIZED_MODULE_COUNT = False
+
+# Largest batch accepted by /api/progress/sync/
+PROGRESS_SYNC_MAX_OPERATIONS = 500
+
+# Reflection answers of at least this many bytes are stored compressed
+REFLECTION_ANSWER_COMPRESS_BYTES = 1024
+
+# Lifetime of signed API tokens issued at login/register, in seconds
+SIGNED_TOKEN_MAX_AGE = 7 * 24 * 60 * 60
+
+# How often each process re-reads revoked signed tokens, in seconds
+SIGNED_TOKEN_REVOCATION_REFRESH = 5
+
+# Password hashing pool used by login/register (see users.hashing). At most
+# WORKERS + MAX_QUEUE request threads per process wait on hashing at once;
+# keep the sum below the server's threads per process
+PASSWORD_HASHING_WORKERS = int(os.environ.get('PASSWORD_HASHING_WORKERS', max(1, (os.cpu_count() or 1) // 2)))
+PASSWORD_HASHING_MAX_QUEUE = int(os.environ.get('PASSWORD_HASHING_MAX_QUEUE', 0))
+
+# Bulk cohort imports (see users.cohorts); None hashes on every core
+PASSWORD_IMPORT_WORKERS = None
+COHORT_IMPORT_BATCH_SIZE = 1000
+
+# Full-text search backend (use 'courses.search.PostgresSearchBackend' on Postgres)
+SEARCH_BACKEND = 'courses.search.SQLiteFTS5Backend'
+SEARCH_MAX_RESULTS = 50
+
+# Add a Server-Timing header (db/view/serialize/render/size/total) to responses
+SERVER_TIMING = True
+
+# Bearer token Prometheus uses to scrape /api/metrics/ (staff users can always read it)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+# Directory for offline course packs (see courses.packs)
+COURSE_PACK_ROOT = os.environ.get('COURSE_PACK_ROOT', BASE_DIR / 'packs')
@@ -2,8 +2,11 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from .metrics import metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/metrics/', metrics, name='metrics'),
     path('api/', include('courses.urls')),
     path('api/auth/', include('users.urls')),
 ]
@@ -0,0 +1,135 @@
+"""Incrementally maintained completion funnel rollups."""
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+
+from .models import ModuleDailyFunnel, ModuleFunnel, UserProgress
+
+
+def progress_state(progress, created_at=None):
+    """What ``rebuild_funnels`` reads from a progress row: ``(created_at, completed, completed_at)``.
+
+    ``created_at`` stands in for rows not inserted yet.
+    """
+    return (progress.created_at or created_at, progress.completed, progress.completed_at)
+
+
+class FunnelChanges:
+    """Funnel counter changes collected while writing progress rows.
+
+    Each change applies the difference between what ``rebuild_funnels``
+    would count for the row before and after the write, so the live
+    counters and a rebuild always agree: a start counts on the day the row
+    was created and a completion on its ``completed_at`` day.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.daily = {}
+
+    def change(self, module_id, before, after):
+        """Record a progress row going from state ``before`` to ``after`` (see ``progress_state``).
+
+        ``before`` is None for a new row.
+        """
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            created_at, completed, completed_at = state
+            self._add(self.totals, module_id, sign, sign * int(completed))
+            self._add(self.daily, (module_id, timezone.localdate(created_at)), sign, 0)
+            if completed and completed_at is not None:
+                self._add(self.daily, (module_id, timezone.localdate(completed_at)), 0, sign)
+
+    def _add(self, counters, key, started, completed):
+        counts = counters.setdefault(key, [0, 0])
+        counts[0] += started
+        counts[1] += completed
+
+
+def record_funnel_events(changes):
+    """Apply FunnelChanges to the funnel counters.
+
+    Must run inside the transaction that writes the progress rows, so
+    counters and rows commit together. Counts are added with F()
+    expressions, so concurrent writers do not lose updates; a completion
+    moving to another day is also decremented on the old one.
+    """
+    now = timezone.now()
+    add_counts(ModuleFunnel, ['module_id'], {
+        (module_id,): counts for module_id, counts in changes.totals.items()
+    }, updated_at=now)
+    add_counts(ModuleDailyFunnel, ['module_id', 'date'], changes.daily)
+
+
+def add_counts(model, key_fields, counts, **values):
+    """Add ``counts`` (``{key: [started, completed]}``) to ``model``'s counter rows.
+
+    Rows that will be incremented are created first with zero counts by
+    one ``bulk_create`` that skips existing rows. Then each distinct change
+    is one F() update over all keys it applies to. Decrements stop at zero.
+    """
+    model.objects.bulk_create(
+        [model(**dict(zip(key_fields, key)), **values) for key, change in counts.items() if max(change) > 0],
+        ignore_conflicts=True,
+    )
+    keys_by_change = {}
+    for key, change in counts.items():
+        if any(change):
+            keys_by_change.setdefault(tuple(change), []).append(key)
+    for (started, completed), keys in keys_by_change.items():
+        match = Q()
+        for key in keys:
+            match |= Q(**dict(zip(key_fields, key)))
+        model.objects.filter(match).update(
+            started=add_count('started', started), completed=add_count('completed', completed), **values
+        )
+
+
+def add_count(field, count):
+    if count >= 0:
+        return F(field) + count
+    # Subtract from at least -count so unsigned columns never go negative mid-expression.
+    return Greatest(F(field), -count) + count
+
+
+def rebuild_funnels(batch_size=1000, apps=None):
+    """Recompute every funnel counter from UserProgress.
+
+    A row counts as started on the day it was created and as completed on
+    its ``completed_at`` day. Call inside a transaction. Migrations pass
+    their ``apps`` to run it on the historical models.
+    """
+    progress_model, funnel_model, daily_model = (
+        (UserProgress, ModuleFunnel, ModuleDailyFunnel) if apps is None else
+        (apps.get_model('courses', name) for name in ('UserProgress', 'ModuleFunnel', 'ModuleDailyFunnel'))
+    )
+    totals = list(progress_model.objects.order_by().values('module_id').annotate(
+        started=Count('id'), completed=Count('id', filter=Q(completed=True))
+    ))
+    funnel_model.objects.all().delete()
+    funnel_model.objects.bulk_create(
+        [funnel_model(**row) for row in totals], batch_size=batch_size
+    )
+
+    daily = {}
+    started = progress_model.objects.order_by().annotate(day=TruncDate('created_at')).values(
+        'module_id', 'day'
+    ).annotate(count=Count('id'))
+    completed = progress_model.objects.filter(completed=True, completed_at__isnull=False).order_by().annotate(
+        day=TruncDate('completed_at')
+    ).values('module_id', 'day').annotate(count=Count('id'))
+    for row in started:
+        daily.setdefault((row['module_id'], row['day']), [0, 0])[0] = row['count']
+    for row in completed:
+        daily.setdefault((row['module_id'], row['day']), [0, 0])[1] = row['count']
+
+    daily_model.objects.all().delete()
+    daily_model.objects.bulk_create(
+        [
+            daily_model(module_id=module_id, date=day, started=counts[0], completed=counts[1])
+            for (module_id, day), counts in daily.items()
+        ],
+        batch_size=batch_size,
+    )
+    return len(totals), len(daily)
@@ -0,0 +1,87 @@
+"""Learners' reflection answers, stored one row per question.
+
+The API keys a module's answers by question position (``"0"``, ``"1"``,
+...), the numbering the module page shows; rows point at the
+ReflectionQuestion itself. Answers of at least
+``REFLECTION_ANSWER_COMPRESS_BYTES`` are stored zlib-compressed, so
+progress rows stay small however much learners write.
+"""
+import zlib
+
+from django.conf import settings
+
+from .models import ReflectionAnswer, ReflectionQuestion
+
+
+class UnknownQuestion(ValueError):
+    """Raised for an answer key that is not a question of the module."""
+
+
+def encode_answer(text):
+    """Return ``(body, compressed)`` for storing ``text``."""
+    data = text.encode('utf-8')
+    if len(data) >= settings.REFLECTION_ANSWER_COMPRESS_BYTES:
+        packed = zlib.compress(data)
+        if len(packed) < len(data):
+            return packed, True
+    return data, False
+
+
+def decode_answer(body, compressed):
+    data = bytes(body)
+    return (zlib.decompress(data) if compressed else data).decode('utf-8')
+
+
+def module_questions(module_ids):
+    """Map each module ID to its question IDs in position order."""
+    questions = {}
+    for module_id, question_id in ReflectionQuestion.objects.filter(
+        module_id__in=module_ids
+    ).order_by('order', 'id').values_list('module_id', 'id'):
+        questions.setdefault(module_id, []).append(question_id)
+    return questions
+
+
+def answer_rows(user, question_ids, answers):
+    """Build ReflectionAnswer rows for ``answers`` keyed by question position.
+
+    ``question_ids`` are the module's questions in position order. Raises
+    UnknownQuestion for a key that does not name one of them.
+    """
+    rows = []
+    for key, text in answers.items():
+        position = int(key) if str(key).isdigit() else -1
+        if not 0 <= position < len(question_ids):
+            raise UnknownQuestion(f'No reflection question {key!r} in this module.')
+        body, compressed = encode_answer(str(text))
+        rows.append(ReflectionAnswer(
+            user=user, question_id=question_ids[position], body=body, compressed=compressed,
+        ))
+    return rows
+
+
+def save_answers(rows):
+    """Insert or overwrite answers; answers to other questions are kept."""
+    ReflectionAnswer.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['user', 'question'],
+        update_fields=['body', 'compressed', 'updated_at'],
+    )
+
+
+def load_answers(user_ids, module_ids):
+    """Return ``{(user_id, module_id): {position: text}}`` for the given users and modules."""
+    positions = {
+        question_id: (module_id, str(position))
+        for module_id, question_ids in module_questions(module_ids).items()
+        for position, question_id in enumerate(question_ids)
+    }
+    answers = {}
+    rows = ReflectionAnswer.objects.filter(
+        user_id__in=user_ids, question_id__in=list(positions)
+    ).values_list('user_id', 'question_id', 'body', 'compressed')
+    for user_id, question_id, body, compressed in rows:
+        module_id, position = positions[question_id]
+        answers.setdefault((user_id, module_id), {})[position] = decode_answer(body, compressed)
+    return answers
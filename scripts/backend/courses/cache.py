@@ -0,0 +1,77 @@
+"""Pre-rendered response cache for course content."""
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ContentVersion
+
+CONTENT_VERSION_ID = 1
+
+
+class RenderedContentCache:
+    """Thread-safe LRU of rendered response bodies, capped by total size."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def set(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+content_cache = RenderedContentCache(
+    getattr(settings, 'CONTENT_CACHE_MAX_BYTES', 16 * 1024 * 1024)
+)
+
+
+def get_content_version():
+    """Return the current content version (0 before any content change)."""
+    version = ContentVersion.objects.filter(pk=CONTENT_VERSION_ID).values_list(
+        'version', flat=True
+    ).first()
+    return version or 0
+
+
+def bump_content_version():
+    """Invalidate every cached rendering of course content.
+
+    The version row is shared by all workers, so entries rendered under an
+    older version are never served again and age out of each LRU. The local
+    cache is cleared straight away since its entries are now unreachable.
+    """
+    updated = ContentVersion.objects.filter(pk=CONTENT_VERSION_ID).update(
+        version=F('version') + 1, updated_at=timezone.now()
+    )
+    if not updated:
+        ContentVersion.objects.get_or_create(pk=CONTENT_VERSION_ID, defaults={'version': 1})
+    content_cache.clear()
@@ -0,0 +1,171 @@
+"""Append-only log of course content changes, for delta sync.
+
+Every insert, update and delete of a content row appends a ContentChange
+whose ID is the sync cursor. Clients fetch content in full once, then ask
+``/api/content/changes/?since=<cursor>`` for the rows changed after it.
+Writers take a row lock on ContentVersion before appending, so entries
+are numbered in commit order and a cursor never skips a late commit.
+
+Compaction drops entries superseded by a newer one for the same row,
+which every client can lose safely, and optionally everything up to a
+cursor; clients still behind that point are told to refetch in full.
+"""
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef, Q
+
+from .cache import CONTENT_VERSION_ID
+from .models import (
+    Course, Module, ContentSection, ContentPoint,
+    ContentExample, ReflectionQuestion, ContentChange, ContentVersion
+)
+
+KINDS = {
+    Course: 'course',
+    Module: 'module',
+    ContentSection: 'section',
+    ContentPoint: 'point',
+    ContentExample: 'example',
+    ReflectionQuestion: 'question',
+}
+MODELS = {kind: model for model, kind in KINDS.items()}
+
+# Columns sent for each changed row, and which rows clients may see.
+FIELDS = {
+    'course': ('id', 'slug', 'title', 'description', 'icon', 'color', 'order'),
+    'module': ('id', 'course_id', 'slug', 'title', 'objective', 'order', 'capstone_task'),
+    'section': ('id', 'module_id', 'title', 'description', 'order'),
+    'point': ('id', 'section_id', 'text', 'order'),
+    'example': ('id', 'section_id', 'text', 'order'),
+    'question': ('id', 'module_id', 'question', 'order'),
+}
+VISIBLE = {
+    'course': Q(is_published=True),
+    'module': Q(is_published=True, course__is_published=True),
+    'section': Q(module__is_published=True, module__course__is_published=True),
+    'question': Q(module__is_published=True, module__course__is_published=True),
+    'point': Q(section__module__is_published=True, section__module__course__is_published=True),
+    'example': Q(section__module__is_published=True, section__module__course__is_published=True),
+}
+
+CHANGES_PAGE_SIZE = 500
+MAX_CHANGES_PAGE_SIZE = 5000
+
+
+def lock_change_log():
+    """Block other change log writers until the current transaction ends."""
+    row = ContentVersion.objects.select_for_update().filter(pk=CONTENT_VERSION_ID)
+    if not list(row.values_list('pk', flat=True)):
+        ContentVersion.objects.get_or_create(pk=CONTENT_VERSION_ID)
+        list(row.values_list('pk', flat=True))
+
+
+def record_changes(changes, batch_size=1000):
+    """Append ``(model, pk, action)`` entries to the change log."""
+    entries = [
+        ContentChange(kind=KINDS[model], object_id=pk, action=action)
+        for model, pk, action in changes
+    ]
+    if not entries:
+        return
+    with transaction.atomic():
+        lock_change_log()
+        ContentChange.objects.bulk_create(entries, batch_size=batch_size)
+
+
+def descendants(course_ids=(), module_ids=()):
+    """Return ``(model, pk)`` for every content row below the given courses and modules.
+
+    Publishing or unpublishing a course or module changes whether clients
+    may see these rows, so they are logged along with it.
+    """
+    course_modules = Module.objects.filter(course_id__in=course_ids)
+    modules = Module.objects.filter(Q(course_id__in=course_ids) | Q(pk__in=module_ids))
+    sections = ContentSection.objects.filter(module__in=modules)
+    rows = [(Module, pk) for pk in course_modules.values_list('pk', flat=True)]
+    rows += [(ContentSection, pk) for pk in sections.values_list('pk', flat=True)]
+    rows += [
+        (ReflectionQuestion, pk)
+        for pk in ReflectionQuestion.objects.filter(module__in=modules).values_list('pk', flat=True)
+    ]
+    for model in (ContentPoint, ContentExample):
+        rows += [(model, pk) for pk in model.objects.filter(section__in=sections).values_list('pk', flat=True)]
+    return rows
+
+
+def log_bounds():
+    """Return ``(compacted_through, head)`` cursors of the change log."""
+    floor = ContentVersion.objects.filter(pk=CONTENT_VERSION_ID).values_list(
+        'compacted_through', flat=True
+    ).first() or 0
+    head = ContentChange.objects.aggregate(head=Max('pk'))['head'] or 0
+    return floor, max(floor, head)
+
+
+def changes_since(since, limit=CHANGES_PAGE_SIZE):
+    """Return the content rows changed after cursor ``since``.
+
+    Reads at most ``limit`` log entries (capped at MAX_CHANGES_PAGE_SIZE);
+    ``has_more`` says whether to ask again. Each row appears once, at its latest change: ``upsert`` with its
+    current values, or ``delete`` when it was removed or is no longer
+    visible. When ``since`` is missing, compacted away or from another
+    database, the response has ``reset`` set and the current head cursor;
+    the client should then refetch content in full.
+    """
+    floor, head = log_bounds()
+    if since is None or since < floor or since > head:
+        return {'reset': True, 'cursor': head, 'has_more': False, 'changes': []}
+
+    limit = min(max(limit, 1), MAX_CHANGES_PAGE_SIZE)
+    entries = list(
+        ContentChange.objects.filter(pk__gt=since).order_by('pk')
+        .values_list('pk', 'kind', 'object_id', 'action')[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    latest = {}
+    for _, kind, object_id, action in entries:
+        latest.pop((kind, object_id), None)
+        latest[(kind, object_id)] = action
+
+    upserts = {}
+    for (kind, object_id), action in latest.items():
+        if action != 'delete':
+            upserts.setdefault(kind, []).append(object_id)
+    rows = {}
+    for kind, ids in upserts.items():
+        for row in MODELS[kind].objects.filter(VISIBLE[kind], pk__in=ids).values(*FIELDS[kind]):
+            rows[(kind, row['id'])] = row
+
+    changes = []
+    for key in latest:
+        row = rows.get(key)
+        if row is None:
+            changes.append({'type': key[0], 'id': key[1], 'op': 'delete'})
+        else:
+            changes.append({'type': key[0], 'id': key[1], 'op': 'upsert', 'data': row})
+    return {
+        'reset': False,
+        'cursor': entries[-1][0] if entries else since,
+        'has_more': has_more,
+        'changes': changes,
+    }
+
+
+def compact_changes(through=None):
+    """Delete superseded entries, and every entry up to cursor ``through``.
+
+    Returns the number of entries deleted.
+    """
+    with transaction.atomic():
+        lock_change_log()
+        newer = ContentChange.objects.filter(
+            kind=OuterRef('kind'), object_id=OuterRef('object_id'), pk__gt=OuterRef('pk')
+        )
+        deleted, _ = ContentChange.objects.filter(Exists(newer)).delete()
+        if through:
+            deleted += ContentChange.objects.filter(pk__lte=through).delete()[0]
+            ContentVersion.objects.filter(
+                pk=CONTENT_VERSION_ID, compacted_through__lt=through
+            ).update(compacted_through=through)
+    return deleted
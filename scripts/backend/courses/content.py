@@ -0,0 +1,338 @@
+"""Declarative course content bundles.
+
+A bundle is a JSON document holding the full content tree::
+
+    {"courses": [{"slug": ..., "title": ..., "description": ..., "icon": ...,
+                  "color": ..., "is_published": true,
+                  "modules": [{"slug": ..., "title": ..., "objective": ...,
+                               "capstone_task": null, "is_published": true,
+                               "sections": [{"title": ..., "description": ...,
+                                             "points": [...], "examples": [...]}],
+                               "reflection_questions": [...]}]}]}
+
+List position gives each row's ``order``. Loading diffs the bundle against
+the database (courses by slug, modules by course and slug, everything else
+by parent and order) and applies only the differences with bulk queries,
+so existing rows keep their primary keys and UserProgress stays attached.
+Stored reflection answers follow their question's row, so a bundle that
+would delete an answered question or change its text is refused unless
+``allow_answer_changes`` is set.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch
+from django.utils import timezone
+
+from .cache import bump_content_version
+from .changes import descendants, record_changes
+from .search import schedule_reindex
+from .models import (
+    Course, Module, ContentSection, ContentPoint,
+    ContentExample, ReflectionAnswer, ReflectionQuestion
+)
+
+COURSE_FIELDS = ['title', 'description', 'icon', 'color', 'order', 'is_published']
+MODULE_FIELDS = ['title', 'objective', 'order', 'capstone_task', 'is_published']
+SECTION_FIELDS = ['title', 'description']
+TEXT_FIELDS = ['text']
+QUESTION_FIELDS = ['question']
+
+
+class BundleError(ValueError):
+    """Raised for a malformed content bundle."""
+
+
+class ContentSync:
+    """Diff a content bundle against the database and apply the changes."""
+
+    def __init__(self, prune=False, batch_size=500, allow_answer_changes=False):
+        self.prune = prune
+        self.allow_answer_changes = allow_answer_changes
+        self.batch_size = batch_size
+        self.now = timezone.now()
+        self.stats = defaultdict(lambda: {'created': 0, 'updated': 0, 'deleted': 0})
+        self.dirty_modules = set()
+        self.dirty_courses = set()
+        self.changes = []
+        self.visibility_changed = defaultdict(list)
+
+    def sync(self, model, existing, desired, fields, owner):
+        """Create, update and delete ``model`` rows so ``existing`` matches ``desired``.
+
+        ``existing`` maps keys to instances and ``desired`` maps keys to
+        field values (including the parent foreign key). ``owner`` returns
+        the ``(module_id, course_id)`` whose timestamps a change should bump.
+        Returns the resulting instances by key. Creates and updates are
+        added to the change log in ``finish()``; deletes are logged by the
+        content signals, which also cover cascaded rows.
+        """
+        stats = self.stats[model._meta.verbose_name_plural]
+        to_create, to_update = [], []
+        result = {}
+
+        for key, values in desired.items():
+            instance = existing.get(key)
+            if instance is None:
+                instance = model(**values)
+                to_create.append(instance)
+            elif any(getattr(instance, name) != values[name] for name in fields):
+                if 'is_published' in fields and instance.is_published != values['is_published']:
+                    self.visibility_changed[model].append(instance.pk)
+                for name in fields:
+                    setattr(instance, name, values[name])
+                to_update.append(instance)
+            else:
+                result[key] = instance
+                continue
+            result[key] = instance
+            self.mark_dirty(*owner(instance))
+
+        to_delete = [instance for key, instance in existing.items() if key not in desired]
+        for instance in to_delete:
+            self.mark_dirty(*owner(instance))
+
+        if to_update:
+            update_fields = list(fields)
+            if hasattr(model, 'updated_at'):
+                for instance in to_update:
+                    instance.updated_at = self.now
+                update_fields.append('updated_at')
+            model.objects.bulk_update(to_update, update_fields, batch_size=self.batch_size)
+        if to_create:
+            model.objects.bulk_create(to_create, batch_size=self.batch_size)
+        self.changes += [(model, instance.pk, 'update') for instance in to_update]
+        self.changes += [(model, instance.pk, 'insert') for instance in to_create]
+        if to_delete:
+            model.objects.filter(pk__in=[instance.pk for instance in to_delete]).delete()
+
+        stats['created'] += len(to_create)
+        stats['updated'] += len(to_update)
+        stats['deleted'] += len(to_delete)
+        return result
+
+    def mark_dirty(self, module_id, course_id):
+        if module_id is not None:
+            self.dirty_modules.add(module_id)
+        if course_id is not None:
+            self.dirty_courses.add(course_id)
+
+    def load(self, bundle):
+        courses_data = bundle.get('courses')
+        if not isinstance(courses_data, list):
+            raise BundleError('Bundle must contain a "courses" list.')
+        answered = self.answered_questions()
+
+        course_values = {}
+        for order, data in enumerate(courses_data):
+            values = {
+                'slug': require(data, 'slug'),
+                'title': require(data, 'title'),
+                'description': data.get('description', ''),
+                'icon': data.get('icon', ''),
+                'color': data.get('color') or 'gold',
+                'order': order,
+                'is_published': data.get('is_published', True),
+            }
+            if values['slug'] in course_values:
+                raise BundleError(f"Duplicate course slug {values['slug']!r}.")
+            course_values[values['slug']] = values
+
+        existing_courses = {course.slug: course for course in Course.objects.all()}
+        if not self.prune:
+            existing_courses = {
+                slug: course for slug, course in existing_courses.items() if slug in course_values
+            }
+        courses = self.sync(
+            Course, existing_courses, course_values, COURSE_FIELDS,
+            owner=lambda course: (None, course.pk),
+        )
+
+        course_ids = [course.pk for course in courses.values()]
+        module_values, modules_data = {}, {}
+        for data in courses_data:
+            course = courses[data['slug']]
+            for order, module in enumerate(data.get('modules', [])):
+                key = (course.pk, require(module, 'slug'))
+                if key in module_values:
+                    raise BundleError(f'Duplicate module slug {key[1]!r} in course {course.slug!r}.')
+                module_values[key] = {
+                    'course_id': course.pk,
+                    'slug': key[1],
+                    'title': require(module, 'title'),
+                    'objective': module.get('objective', ''),
+                    'order': order,
+                    'capstone_task': module.get('capstone_task'),
+                    'is_published': module.get('is_published', True),
+                }
+                modules_data[key] = module
+
+        modules = self.sync(
+            Module,
+            {(m.course_id, m.slug): m for m in Module.objects.filter(course_id__in=course_ids)},
+            module_values, MODULE_FIELDS,
+            owner=lambda module: (module.pk, module.course_id),
+        )
+        module_courses = {module.pk: module.course_id for module in modules.values()}
+
+        section_values, sections_data, question_values = {}, {}, {}
+        for key, data in modules_data.items():
+            module = modules[key]
+            for order, section in enumerate(data.get('sections', [])):
+                section_values[(module.pk, order)] = {
+                    'module_id': module.pk,
+                    'title': require(section, 'title'),
+                    'description': section.get('description'),
+                    'order': order,
+                }
+                sections_data[(module.pk, order)] = section
+            for order, question in enumerate(data.get('reflection_questions', [])):
+                question_values[(module.pk, order)] = {
+                    'module_id': module.pk, 'question': question, 'order': order,
+                }
+
+        module_ids = list(module_courses)
+        by_module = lambda row: (row.module_id, module_courses.get(row.module_id))
+        sections = self.sync(
+            ContentSection,
+            {(s.module_id, s.order): s for s in ContentSection.objects.filter(module_id__in=module_ids)},
+            section_values, SECTION_FIELDS, owner=by_module,
+        )
+        self.sync(
+            ReflectionQuestion,
+            {(q.module_id, q.order): q for q in ReflectionQuestion.objects.filter(module_id__in=module_ids)},
+            question_values, QUESTION_FIELDS, owner=by_module,
+        )
+
+        section_modules = {section.pk: section.module_id for section in sections.values()}
+        for model, name in ((ContentPoint, 'points'), (ContentExample, 'examples')):
+            values = {}
+            for key, data in sections_data.items():
+                section_id = sections[key].pk
+                for order, text in enumerate(data.get(name, [])):
+                    values[(section_id, order)] = {'section_id': section_id, 'text': text, 'order': order}
+            existing = model.objects.filter(section_id__in=list(section_modules))
+            self.sync(
+                model, {(row.section_id, row.order): row for row in existing}, values, TEXT_FIELDS,
+                owner=lambda row: (
+                    section_modules.get(row.section_id),
+                    module_courses.get(section_modules.get(row.section_id)),
+                ),
+            )
+
+        self.check_answered(answered)
+        self.finish()
+        return dict(self.stats)
+
+    def answered_questions(self):
+        """Text and location of every reflection question learners have answered."""
+        if self.allow_answer_changes:
+            return {}
+        return {
+            pk: (text, f'{course_slug}/{module_slug} question {order + 1}')
+            for pk, text, order, module_slug, course_slug in ReflectionQuestion.objects.filter(
+                Exists(ReflectionAnswer.objects.filter(question=OuterRef('pk')))
+            ).values_list('pk', 'question', 'order', 'module__slug', 'module__course__slug')
+        }
+
+    def check_answered(self, answered):
+        """Refuse the load if an answered question was deleted or reworded.
+
+        Questions are matched by position, so inserting or removing one
+        moves the answers of the questions after it onto other text.
+        """
+        current = dict(ReflectionQuestion.objects.filter(pk__in=answered).values_list('pk', 'question'))
+        changed = sorted(where for pk, (text, where) in answered.items() if current.get(pk) != text)
+        if changed:
+            raise BundleError(
+                f"{len(changed)} answered reflection question(s) would be deleted or reworded, "
+                f"deleting or misattributing learners' answers: {', '.join(changed[:5])}"
+                f"{' ...' if len(changed) > 5 else ''}. Pass allow_answer_changes "
+                "(load_content --allow-answer-changes) to apply anyway."
+            )
+
+    def finish(self):
+        """Log changes and bump timestamps, module counts, search documents and the content version."""
+        if not (self.dirty_modules or self.dirty_courses):
+            return
+        hidden_or_shown = descendants(self.visibility_changed[Course], self.visibility_changed[Module])
+        record_changes(self.changes + [(model, pk, 'update') for model, pk in hidden_or_shown])
+        Module.objects.filter(pk__in=self.dirty_modules).update(updated_at=self.now)
+        courses = Course.objects.filter(pk__in=self.dirty_courses)
+        courses.update(updated_at=self.now)
+        courses.refresh_published_module_counts()
+        module_ids = self.dirty_modules | set(
+            Module.objects.filter(course_id__in=self.dirty_courses).values_list('id', flat=True)
+        )
+        schedule_reindex(module_ids)
+        transaction.on_commit(bump_content_version)
+
+
+def require(data, name):
+    value = data.get(name)
+    if not value:
+        raise BundleError(f'Missing {name!r} in {data!r:.80}.')
+    return value
+
+
+def load_bundle(bundle, prune=False, dry_run=False, allow_answer_changes=False):
+    """Apply ``bundle`` in one transaction and return per-model change counts.
+
+    Courses missing from the bundle are deleted only when ``prune`` is set.
+    With ``dry_run`` the changes are computed and rolled back.
+    """
+    with transaction.atomic():
+        stats = ContentSync(prune=prune, allow_answer_changes=allow_answer_changes).load(bundle)
+        if dry_run:
+            transaction.set_rollback(True)
+    return stats
+
+
+def export_bundle():
+    """Return the database's course content as a bundle."""
+    sections = ContentSection.objects.order_by('order', 'id').prefetch_related(
+        Prefetch('points', queryset=ContentPoint.objects.order_by('order', 'id')),
+        Prefetch('examples', queryset=ContentExample.objects.order_by('order', 'id')),
+    )
+    modules = Module.objects.order_by('order', 'id').prefetch_related(
+        Prefetch('content_sections', queryset=sections),
+        Prefetch('reflection_questions', queryset=ReflectionQuestion.objects.order_by('order', 'id')),
+    )
+    courses = Course.objects.order_by('order', 'id').prefetch_related(
+        Prefetch('modules', queryset=modules)
+    )
+    return {
+        'courses': [
+            {
+                'slug': course.slug,
+                'title': course.title,
+                'description': course.description,
+                'icon': course.icon,
+                'color': course.color,
+                'is_published': course.is_published,
+                'modules': [
+                    {
+                        'slug': module.slug,
+                        'title': module.title,
+                        'objective': module.objective,
+                        'capstone_task': module.capstone_task,
+                        'is_published': module.is_published,
+                        'sections': [
+                            {
+                                'title': section.title,
+                                'description': section.description,
+                                'points': [point.text for point in section.points.all()],
+                                'examples': [example.text for example in section.examples.all()],
+                            }
+                            for section in module.content_sections.all()
+                        ],
+                        'reflection_questions': [
+                            question.question for question in module.reflection_questions.all()
+                        ],
+                    }
+                    for module in course.modules.all()
+                ],
+            }
+            for course in courses
+        ]
+    }
@@ -0,0 +1,108 @@
+"""Streaming export of user progress for reporting."""
+import csv
+import json
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .answers import load_answers
+from .models import UserProgress
+
+EXPORT_FORMATS = ['ndjson', 'csv']
+EXPORT_COLUMNS = [
+    'id', 'user_id', 'username', 'email', 'organization', 'course_slug',
+    'module_slug', 'completed', 'completed_at', 'created_at', 'updated_at',
+    'reflection_answers',
+]
+EXPORT_FIELDS = [
+    'id', 'user_id', 'user__username', 'user__email', 'user__profile__organization',
+    'module__course__slug', 'module__slug', 'completed', 'completed_at',
+    'created_at', 'updated_at', 'module_id',
+]
+
+
+def parse_boundary(value, end=False):
+    """Parse an ISO date or datetime filter value; ``None`` if it is invalid.
+
+    A bare date covers the whole day, so as an upper bound it means the
+    start of the following day.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            return None
+        moment = datetime.combine(day, time.min)
+        if end:
+            moment += timedelta(days=1)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment, dt_timezone.utc)
+    return moment
+
+
+def progress_export_queryset(course=None, completed_after=None, completed_before=None,
+                             organization=None):
+    queryset = UserProgress.objects.all()
+    if course:
+        queryset = queryset.filter(module__course__slug=course)
+    if completed_after:
+        queryset = queryset.filter(completed_at__gte=completed_after)
+    if completed_before:
+        queryset = queryset.filter(completed_at__lt=completed_before)
+    if organization:
+        queryset = queryset.filter(user__profile__organization__iexact=organization)
+    return queryset
+
+
+def iter_progress_rows(queryset, chunk_size=2000):
+    """Yield export rows as dicts, reading ``chunk_size`` rows per query.
+
+    Walks the primary key in keyset order instead of holding one cursor
+    open, so memory stays flat and each read is a short statement that
+    never keeps a snapshot or lock open against progress writes.
+    Reflection answers are read with one extra query per chunk.
+    """
+    last_id = 0
+    while True:
+        chunk = list(
+            queryset.filter(id__gt=last_id).order_by('id').values_list(*EXPORT_FIELDS)[:chunk_size]
+        )
+        answers = load_answers({values[1] for values in chunk}, {values[-1] for values in chunk}) if chunk else {}
+        for *values, module_id in chunk:
+            row = dict(zip(EXPORT_COLUMNS, values))
+            row['reflection_answers'] = answers.get((row['user_id'], module_id), {})
+            yield row
+        if len(chunk) < chunk_size:
+            return
+        last_id = chunk[-1][0]
+
+
+class Echo:
+    """File-like object whose ``write`` returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def render_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def render_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        row['reflection_answers'] = json.dumps(row['reflection_answers'], ensure_ascii=False)
+        row['completed_at'] = row['completed_at'] and row['completed_at'].isoformat()
+        row['created_at'] = row['created_at'].isoformat()
+        row['updated_at'] = row['updated_at'].isoformat()
+        yield writer.writerow([row[column] for column in EXPORT_COLUMNS])
+
+
+RENDERERS = {
+    'ndjson': (render_ndjson, 'application/x-ndjson'),
+    'csv': (render_csv, 'text/csv'),
+}
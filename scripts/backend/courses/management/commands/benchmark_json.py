@@ -0,0 +1,63 @@
+"""Compare the fast JSON renderer/parser against DRF's stdlib ones."""
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from bfpa_backend.renderers import FastJSONParser, FastJSONRenderer, orjson
+from courses.models import Course
+from courses.serializers import CourseListSerializer, ModuleDetailSerializer
+from courses.queries import module_content_prefetches, published_modules
+
+
+def timed(func, payloads, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            func(payload)
+    return (time.perf_counter() - start) / rounds
+
+
+class Command(BaseCommand):
+    help = 'Benchmark JSON rendering and parsing of real course payloads.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=200)
+
+    def handle(self, *args, **options):
+        modules = published_modules().prefetch_related(*module_content_prefetches())
+        payloads = [ModuleDetailSerializer(module).data for module in modules]
+        payloads.append(CourseListSerializer(Course.objects.with_module_count(), many=True).data)
+        if len(payloads) < 2:
+            raise CommandError('No course content loaded; run load_content first.')
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; the fast path falls back to stdlib.'))
+
+        stdlib, fast = JSONRenderer(), FastJSONRenderer()
+        rendered = []
+        for payload in payloads:
+            expected = stdlib.render(payload)
+            if fast.render(payload) != expected:
+                raise CommandError('FastJSONRenderer output differs from JSONRenderer.')
+            rendered.append(expected)
+        for body in rendered:
+            if FastJSONParser().parse(io.BytesIO(body)) != JSONParser().parse(io.BytesIO(body)):
+                raise CommandError('FastJSONParser output differs from JSONParser.')
+
+        rounds = options['rounds']
+        total = sum(len(body) for body in rendered)
+        self.stdout.write(f'{len(payloads)} payloads, {total} bytes, {rounds} rounds')
+        results = (
+            ('render', timed(stdlib.render, payloads, rounds), timed(fast.render, payloads, rounds)),
+            ('parse',
+             timed(lambda b: JSONParser().parse(io.BytesIO(b)), rendered, rounds),
+             timed(lambda b: FastJSONParser().parse(io.BytesIO(b)), rendered, rounds)),
+        )
+        for name, slow, quick in results:
+            self.stdout.write(
+                f'{name:<7} stdlib {slow * 1000:8.3f} ms  fast {quick * 1000:8.3f} ms  '
+                f'({slow / quick:.1f}x)'
+            )
+        self.stdout.write(self.style.SUCCESS('Output is byte-identical.'))
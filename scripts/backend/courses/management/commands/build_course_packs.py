@@ -0,0 +1,26 @@
+"""Build offline course packs for published courses."""
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.models import Course
+from courses.packs import ensure_pack, prune_packs
+
+
+class Command(BaseCommand):
+    help = 'Build compressed offline packs for courses whose content changed, and prune stale files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', help='Only build the pack for this course slug.')
+        parser.add_argument('--force', action='store_true', help='Rebuild even if the pack is current.')
+
+    def handle(self, *args, **options):
+        courses = Course.objects.filter(is_published=True).order_by('order', 'id')
+        if options['course']:
+            courses = courses.filter(slug=options['course'])
+            if not courses.exists():
+                raise CommandError(f"No published course {options['course']!r}")
+
+        for course in courses:
+            pack = ensure_pack(course, force=options['force'])
+            self.stdout.write(f'{course.slug}: {pack.file_name} ({pack.size} bytes, sha256 {pack.sha256[:12]})')
+        removed = prune_packs()
+        self.stdout.write(self.style.SUCCESS(f'Course packs built; {removed} stale files removed.'))
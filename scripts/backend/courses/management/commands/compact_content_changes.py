@@ -0,0 +1,38 @@
+"""Compact the content change log."""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+from django.utils import timezone
+
+from courses.changes import compact_changes
+from courses.models import ContentChange
+
+
+class Command(BaseCommand):
+    help = (
+        'Drop change log entries superseded by a newer change to the same row. '
+        'With --through or --days, also drop everything up to that point; '
+        'clients with an older cursor are told to refetch content in full.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--through', type=int, help='Drop every entry up to and including this cursor.')
+        parser.add_argument('--days', type=int, help='Drop every entry older than this many days.')
+
+    def handle(self, *args, **options):
+        through = options['through']
+        if through is not None and options['days'] is not None:
+            raise CommandError('Pass --through or --days, not both.')
+        if options['days'] is not None:
+            cutoff = timezone.now() - timedelta(days=options['days'])
+            through = ContentChange.objects.filter(created_at__lt=cutoff).aggregate(
+                through=Max('pk')
+            )['through']
+
+        deleted = compact_changes(through)
+        remaining = ContentChange.objects.count()
+        message = f'Deleted {deleted} change log entries; {remaining} remain'
+        if through:
+            message += f' (compacted through cursor {through})'
+        self.stdout.write(self.style.SUCCESS(message + '.'))
@@ -0,0 +1,22 @@
+"""Export course content to a declarative bundle file."""
+import json
+
+from django.core.management.base import BaseCommand
+
+from courses.content import export_bundle
+
+
+class Command(BaseCommand):
+    help = 'Write the course content in the database as a JSON content bundle.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('bundle', nargs='?', help='Output path (defaults to stdout).')
+
+    def handle(self, *args, **options):
+        data = json.dumps(export_bundle(), indent=2, ensure_ascii=False) + '\n'
+        if options['bundle']:
+            with open(options['bundle'], 'w', encoding='utf-8') as f:
+                f.write(data)
+            self.stdout.write(self.style.SUCCESS(f"Content exported to {options['bundle']}."))
+        else:
+            self.stdout.write(data, ending='')
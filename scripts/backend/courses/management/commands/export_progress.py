@@ -0,0 +1,39 @@
+"""Stream user progress to NDJSON or CSV."""
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.export import (
+    EXPORT_FORMATS, RENDERERS, iter_progress_rows, parse_boundary, progress_export_queryset
+)
+
+
+class Command(BaseCommand):
+    help = 'Export UserProgress rows (with reflection answers) in constant memory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', choices=EXPORT_FORMATS, default='ndjson')
+        parser.add_argument('--file', help='Write to this path instead of stdout.')
+        parser.add_argument('--course', help='Only export progress in this course slug.')
+        parser.add_argument('--organization', help='Only export learners from this organization.')
+        parser.add_argument('--completed-after', help='ISO date or datetime (inclusive).')
+        parser.add_argument('--completed-before', help='ISO date or datetime (exclusive).')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        filters = {'course': options['course'], 'organization': options['organization']}
+        for name in ('completed_after', 'completed_before'):
+            if options[name]:
+                filters[name] = parse_boundary(options[name], end=name == 'completed_before')
+                if filters[name] is None:
+                    raise CommandError(f'{name} must be an ISO date or datetime')
+
+        render, _ = RENDERERS[options['output']]
+        rows = iter_progress_rows(progress_export_queryset(**filters), options['chunk_size'])
+        out = open(options['file'], 'w', encoding='utf-8', newline='') if options['file'] else sys.stdout
+        try:
+            for line in render(rows):
+                out.write(line)
+        finally:
+            if options['file']:
+                out.close()
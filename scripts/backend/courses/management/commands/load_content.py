@@ -0,0 +1,46 @@
+"""Load course content from a declarative bundle file."""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.content import BundleError, load_bundle
+
+
+class Command(BaseCommand):
+    help = 'Diff a JSON content bundle against the database and apply the changes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('bundle', help='Path to the JSON content bundle.')
+        parser.add_argument(
+            '--prune', action='store_true',
+            help='Delete courses that are not in the bundle (cascades their progress).'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report the changes without committing them.'
+        )
+        parser.add_argument(
+            '--allow-answer-changes', action='store_true',
+            help='Apply even if answered reflection questions are deleted or reworded.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['bundle'], encoding='utf-8') as f:
+                bundle = json.load(f)
+            stats = load_bundle(
+                bundle, prune=options['prune'], dry_run=options['dry_run'],
+                allow_answer_changes=options['allow_answer_changes'],
+            )
+        except (OSError, ValueError, BundleError) as exc:
+            raise CommandError(exc)
+
+        for name, counts in stats.items():
+            self.stdout.write(
+                f"{name}: {counts['created']} created, {counts['updated']} updated, "
+                f"{counts['deleted']} deleted"
+            )
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('Dry run, no changes committed.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Content loaded.'))
@@ -0,0 +1,52 @@
+"""Load test the API over HTTP and report latency percentiles."""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from bfpa_backend.loadtest import LoadTestError, run_load_test
+
+
+class Command(BaseCommand):
+    help = (
+        'Start the API against a throwaway seeded database, drive concurrent virtual users '
+        'through browse/login/read/complete flows and report per-endpoint latency, '
+        'throughput and queries per request.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10, help='Concurrent virtual users.')
+        parser.add_argument('--iterations', type=int, default=25, help='Recorded flows per user.')
+        parser.add_argument('--warmup', type=int, default=2, help='Unrecorded flows per user first.')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the flow/target choices.')
+        parser.add_argument('--bundle', help='Content bundle to seed (default content/courses.json).')
+        parser.add_argument('--output', help='Write the JSON results to this path.')
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['iterations'] < 1:
+            raise CommandError('--users and --iterations must be at least 1')
+        try:
+            results = run_load_test(
+                users=options['users'], iterations=options['iterations'], warmup=options['warmup'],
+                seed_value=options['seed'], bundle=options['bundle'],
+            )
+        except LoadTestError as exc:
+            raise CommandError(str(exc))
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+                f.write('\n')
+
+        self.stdout.write(
+            f"{'endpoint':<46} {'reqs':>6} {'err':>4} {'rps':>8} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8}"
+        )
+        rows = list(results['endpoints'].items()) + [('TOTAL', results['totals'])]
+        for label, stats in rows:
+            latency = stats['latency_ms']
+            queries = stats['queries_per_request']['mean']
+            self.stdout.write(
+                f"{label:<46} {stats['requests']:>6} {stats['errors']:>4} {stats['rps']:>8} "
+                f"{latency['p50']:>8} {latency['p95']:>8} {latency['p99']:>8} {queries if queries is not None else '-':>8}"
+            )
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
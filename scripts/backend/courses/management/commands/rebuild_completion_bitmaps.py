@@ -0,0 +1,53 @@
+"""Rebuild per-user course completion bitmaps from UserProgress."""
+from itertools import groupby
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.models import Course, CourseCompletion, UserProgress
+from courses.progress import completion_bits, published_module_ids
+
+
+class Command(BaseCommand):
+    help = 'Rebuild CourseCompletion bitmaps from UserProgress rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', help='Only rebuild bitmaps for this course slug.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        courses = Course.objects.all()
+        if options['course']:
+            courses = courses.filter(slug=options['course'])
+
+        for course in courses:
+            count = self.rebuild_course(course, options['batch_size'])
+            self.stdout.write(f'{course.slug}: {count} bitmaps')
+        self.stdout.write(self.style.SUCCESS('Completion bitmaps rebuilt.'))
+
+    def rebuild_course(self, course, batch_size):
+        module_ids = published_module_ids(course.pk)
+        rows = UserProgress.objects.filter(
+            module_id__in=module_ids, completed=True
+        ).order_by('user_id').values_list('user_id', 'module_id')
+
+        count = 0
+        batch = []
+        with transaction.atomic():
+            CourseCompletion.objects.filter(course=course).delete()
+            for user_id, group in groupby(rows.iterator(chunk_size=batch_size), key=lambda row: row[0]):
+                completion = CourseCompletion(
+                    user_id=user_id,
+                    course=course,
+                    module_count=len(module_ids),
+                    layout_at=course.updated_at,
+                )
+                completion.set_bits(completion_bits(module_ids, {module_id for _, module_id in group}))
+                batch.append(completion)
+                if len(batch) >= batch_size:
+                    CourseCompletion.objects.bulk_create(batch)
+                    count += len(batch)
+                    batch = []
+            CourseCompletion.objects.bulk_create(batch)
+            count += len(batch)
+        return count
@@ -0,0 +1,16 @@
+"""Rebuild module funnel rollups from UserProgress."""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.analytics import rebuild_funnels
+
+
+class Command(BaseCommand):
+    help = 'Recompute ModuleFunnel and ModuleDailyFunnel counters from UserProgress.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            modules, days = rebuild_funnels()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt funnels for {modules} modules ({days} module-days).'
+        ))
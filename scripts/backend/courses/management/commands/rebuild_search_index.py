@@ -0,0 +1,17 @@
+"""Rebuild the full-text search index over course content."""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.models import SearchDocument
+from courses.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Regenerate every SearchDocument and the full-text index built on them.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            get_search_backend().rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {SearchDocument.objects.count()} search documents.'
+        ))
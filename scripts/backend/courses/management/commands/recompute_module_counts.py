@@ -0,0 +1,12 @@
+"""Recompute the denormalized published module count on every course."""
+from django.core.management.base import BaseCommand
+
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = 'Recompute Course.published_module_count from published modules.'
+
+    def handle(self, *args, **options):
+        updated = Course.objects.all().refresh_published_module_counts()
+        self.stdout.write(self.style.SUCCESS(f'Recomputed module counts for {updated} courses.'))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:55
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_published_module_count(apps, schema_editor):
+    Course = apps.get_model('courses', 'Course')
+    Module = apps.get_model('courses', 'Module')
+    published = Module.objects.filter(
+        course=models.OuterRef('pk'), is_published=True
+    ).order_by().values('course').annotate(count=models.Count('id')).values('count')
+    Course.objects.update(published_module_count=Coalesce(models.Subquery(published), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_contentversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='published_module_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_published_module_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_funnels(apps, schema_editor):
+    from courses.analytics import rebuild_funnels
+    rebuild_funnels(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_coursecompletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ModuleFunnel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('module', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='funnel', to='courses.module')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ModuleDailyFunnel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('started', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('module', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_funnel', to='courses.module')),
+            ],
+            options={
+                'ordering': ['date'],
+                'unique_together': {('module', 'date')},
+            },
+        ),
+        migrations.RunPython(backfill_funnels, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE courses_searchdocument_fts USING fts5(
+        title, body, content='courses_searchdocument', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER courses_searchdocument_ai AFTER INSERT ON courses_searchdocument BEGIN
+        INSERT INTO courses_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER courses_searchdocument_ad AFTER DELETE ON courses_searchdocument BEGIN
+        INSERT INTO courses_searchdocument_fts(courses_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER courses_searchdocument_au AFTER UPDATE ON courses_searchdocument BEGIN
+        INSERT INTO courses_searchdocument_fts(courses_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO courses_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+SQLITE_REVERSE = [
+    'DROP TRIGGER IF EXISTS courses_searchdocument_au',
+    'DROP TRIGGER IF EXISTS courses_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS courses_searchdocument_ai',
+    'DROP TABLE IF EXISTS courses_searchdocument_fts',
+]
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE courses_searchdocument ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX courses_searchdocument_vector ON courses_searchdocument USING GIN (search_vector)',
+]
+POSTGRES_REVERSE = [
+    'DROP INDEX IF EXISTS courses_searchdocument_vector',
+    'ALTER TABLE courses_searchdocument DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+create_search_index = run_vendor_sql({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD})
+drop_search_index = run_vendor_sql({'sqlite': SQLITE_REVERSE, 'postgresql': POSTGRES_REVERSE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_module_funnels'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=40, unique=True)),
+                ('kind', models.CharField(choices=[('module', 'Module'), ('section', 'Section'), ('point', 'Point'), ('example', 'Example'), ('question', 'Reflection question')], max_length=20)),
+                ('course_slug', models.SlugField(max_length=100)),
+                ('module_slug', models.SlugField(max_length=100)),
+                ('title', models.TextField(blank=True)),
+                ('body', models.TextField(blank=True)),
+                ('module', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to='courses.module')),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
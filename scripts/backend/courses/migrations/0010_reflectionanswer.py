@@ -0,0 +1,101 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:31
+
+import zlib
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def question_ids_by_module(ReflectionQuestion):
+    questions = {}
+    for module_id, question_id in ReflectionQuestion.objects.order_by('order', 'id').values_list('module_id', 'id'):
+        questions.setdefault(module_id, []).append(question_id)
+    return questions
+
+
+def move_answers_to_table(apps, schema_editor):
+    """Copy UserProgress.reflection_answers into one row per question.
+
+    Keys are question positions within the module; keys that do not match
+    a question cannot be kept.
+    """
+    UserProgress = apps.get_model('courses', 'UserProgress')
+    ReflectionQuestion = apps.get_model('courses', 'ReflectionQuestion')
+    ReflectionAnswer = apps.get_model('courses', 'ReflectionAnswer')
+    threshold = getattr(settings, 'REFLECTION_ANSWER_COMPRESS_BYTES', 1024)
+    questions = question_ids_by_module(ReflectionQuestion)
+
+    batch = []
+    progress = UserProgress.objects.order_by('id').values_list('user_id', 'module_id', 'reflection_answers')
+    for user_id, module_id, answers in progress.iterator(chunk_size=2000):
+        question_ids = questions.get(module_id, [])
+        for key, text in (answers or {}).items():
+            position = int(key) if str(key).isdigit() else -1
+            if not 0 <= position < len(question_ids):
+                continue
+            data = str(text).encode('utf-8')
+            packed = zlib.compress(data) if len(data) >= threshold else data
+            batch.append(ReflectionAnswer(
+                user_id=user_id, question_id=question_ids[position],
+                body=min(packed, data, key=len), compressed=len(packed) < len(data),
+            ))
+        if len(batch) >= 2000:
+            ReflectionAnswer.objects.bulk_create(batch)
+            batch = []
+    ReflectionAnswer.objects.bulk_create(batch)
+
+
+def move_answers_to_progress(apps, schema_editor):
+    UserProgress = apps.get_model('courses', 'UserProgress')
+    ReflectionQuestion = apps.get_model('courses', 'ReflectionQuestion')
+    ReflectionAnswer = apps.get_model('courses', 'ReflectionAnswer')
+    positions = {
+        question_id: (module_id, str(position))
+        for module_id, question_ids in question_ids_by_module(ReflectionQuestion).items()
+        for position, question_id in enumerate(question_ids)
+    }
+    answers = {}
+    for user_id, question_id, body, compressed in ReflectionAnswer.objects.values_list(
+        'user_id', 'question_id', 'body', 'compressed'
+    ).iterator(chunk_size=2000):
+        module_id, position = positions[question_id]
+        data = bytes(body)
+        answers.setdefault((user_id, module_id), {})[position] = (
+            zlib.decompress(data) if compressed else data
+        ).decode('utf-8')
+    for (user_id, module_id), values in answers.items():
+        UserProgress.objects.update_or_create(
+            user_id=user_id, module_id=module_id, defaults={'reflection_answers': values}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0009_contentchange'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReflectionAnswer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('body', models.BinaryField()),
+                ('compressed', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answers', to='courses.reflectionquestion')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reflection_answers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'question')},
+            },
+        ),
+        migrations.RunPython(move_answers_to_table, move_answers_to_progress),
+        migrations.RemoveField(
+            model_name='userprogress',
+            name='reflection_answers',
+        ),
+    ]
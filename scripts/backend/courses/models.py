@@ -1,6 +1,24 @@
 """Course models for BFPA Platform."""
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.functions import Coalesce
+
+
+class CourseQuerySet(models.QuerySet):
+    def with_module_count(self):
+        """Annotate each course with its number of published modules."""
+        return self.annotate(
+            module_count=models.Count('modules', filter=models.Q(modules__is_published=True))
+        )
+
+    def refresh_published_module_counts(self):
+        """Recompute the denormalized ``published_module_count`` column."""
+        published = Module.objects.filter(
+            course=models.OuterRef('pk'), is_published=True
+        ).order_by().values('course').annotate(count=models.Count('id')).values('count')
+        return self.update(
+            published_module_count=Coalesce(models.Subquery(published), 0)
+        )
 
 
 class Course(models.Model):
@@ -18,9 +36,12 @@ class Course(models.Model):
     color = models.CharField(max_length=20, choices=COLOR_CHOICES, default='gold')
     order = models.PositiveIntegerField(default=0)
     is_published = models.BooleanField(default=True)
+    published_module_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CourseQuerySet.as_manager()
+
     class Meta:
         ordering = ['order']
 
@@ -107,7 +128,6 @@ class UserProgress(models.Model):
     module = models.ForeignKey(Module, on_delete=models.CASCADE)
     completed = models.BooleanField(default=False)
     completed_at = models.DateTimeField(blank=True, null=True)
-    reflection_answers = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -116,3 +136,193 @@ class UserProgress(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.module.title}"
+
+
+class ReflectionAnswer(models.Model):
+    """A learner's answer to one reflection question (see courses.answers).
+
+    ``body`` holds the UTF-8 text, zlib-compressed when ``compressed`` is set.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reflection_answers')
+    question = models.ForeignKey(ReflectionQuestion, on_delete=models.CASCADE, related_name='answers')
+    body = models.BinaryField()
+    compressed = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'question']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.question}"
+
+
+class ContentVersion(models.Model):
+    """Single-row counter bumped whenever course content changes."""
+    version = models.PositiveBigIntegerField(default=0)
+    # Highest change log entry removed by compaction (see courses.changes)
+    compacted_through = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Content version {self.version}"
+
+
+class ProgressSyncOperation(models.Model):
+    """Client operation already applied by the progress sync endpoint."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sync_operations')
+    client_id = models.CharField(max_length=64)
+    applied_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['user', 'client_id']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.client_id}"
+
+
+class CourseCompletion(models.Model):
+    """Per-user completion bitmap for a course.
+
+    Bit ``n`` is set when the ``n``-th published module of the course (by
+    ``order``, then ``id``) is completed. ``layout_at`` records the course's
+    ``updated_at`` when the bitmap was built, so a change to the module
+    layout marks the row stale.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='course_completions')
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='completions')
+    bitmap = models.BinaryField(default=b'')
+    module_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    layout_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'course']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.course.title}"
+
+    @property
+    def bits(self):
+        return int.from_bytes(bytes(self.bitmap), 'little')
+
+    def set_bits(self, bits):
+        self.bitmap = bits.to_bytes((self.module_count + 7) // 8, 'little')
+        self.completed_count = bin(bits).count('1')
+
+    def is_completed(self, position):
+        return bool(self.bits >> position & 1)
+
+    @property
+    def is_stale(self):
+        return self.layout_at != self.course.updated_at
+
+    @property
+    def percentage(self):
+        if not self.module_count:
+            return 0
+        return round(self.completed_count * 100 / self.module_count)
+
+    @property
+    def completed_positions(self):
+        bits = self.bits
+        return [position for position in range(self.module_count) if bits >> position & 1]
+
+    @property
+    def next_position(self):
+        """Position of the first module not yet completed, or ``None``."""
+        bits = self.bits
+        for position in range(self.module_count):
+            if not bits >> position & 1:
+                return position
+        return None
+
+
+class ModuleFunnel(models.Model):
+    """Running count of learners who started and completed a module."""
+    module = models.OneToOneField(Module, on_delete=models.CASCADE, related_name='funnel')
+    started = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.module} funnel"
+
+
+class ModuleDailyFunnel(models.Model):
+    """Per-day count of learners who started and completed a module."""
+    module = models.ForeignKey(Module, on_delete=models.CASCADE, related_name='daily_funnel')
+    date = models.DateField()
+    started = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['module', 'date']
+        ordering = ['date']
+
+    def __str__(self):
+        return f"{self.module} funnel on {self.date}"
+
+
+class SearchDocument(models.Model):
+    """Searchable text of one piece of course content (see courses.search)."""
+    KIND_CHOICES = [
+        ('module', 'Module'),
+        ('section', 'Section'),
+        ('point', 'Point'),
+        ('example', 'Example'),
+        ('question', 'Reflection question'),
+    ]
+
+    key = models.CharField(max_length=40, unique=True)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    module = models.ForeignKey(Module, on_delete=models.CASCADE, related_name='search_documents')
+    course_slug = models.SlugField(max_length=100)
+    module_slug = models.SlugField(max_length=100)
+    title = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+
+    def __str__(self):
+        return self.key
+
+
+class CoursePack(models.Model):
+    """Compressed offline copy of a published course (see courses.packs)."""
+    course = models.OneToOneField(Course, on_delete=models.CASCADE, related_name='pack')
+    file_name = models.CharField(max_length=255)
+    sha256 = models.CharField(max_length=64)
+    size = models.PositiveBigIntegerField()
+    content_updated_at = models.DateTimeField()
+    built_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.file_name
+
+
+class ContentChange(models.Model):
+    """Append-only log of course content inserts, updates and deletes (see courses.changes)."""
+    KIND_CHOICES = [
+        ('course', 'Course'),
+        ('module', 'Module'),
+        ('section', 'Section'),
+        ('point', 'Point'),
+        ('example', 'Example'),
+        ('question', 'Reflection question'),
+    ]
+    ACTION_CHOICES = [
+        ('insert', 'Insert'),
+        ('update', 'Update'),
+        ('delete', 'Delete'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['kind', 'object_id'])]
+
+    def __str__(self):
+        return f"{self.action} {self.kind} {self.object_id}"
@@ -0,0 +1,175 @@
+"""Compressed offline course packs.
+
+A pack is one gzip file holding a published course and the full content
+of its published modules, in the same JSON shapes as the course and module
+detail endpoints. Files are content-addressed (``<slug>-<sha256 prefix>``)
+and rebuilt only when the course's ``updated_at`` moves, which the content
+signals bump on any change below it. Builds are deterministic, so servers
+sharing a database produce byte-identical packs.
+
+Packs are built by the ``build_course_packs`` command, never by requests:
+the endpoints serve the last built pack until it is rebuilt.
+"""
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Prefetch, prefetch_related_objects
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from bfpa_backend.renderers import FastJSONRenderer
+
+from .models import CoursePack
+from .queries import module_content_prefetches, published_modules
+from .serializers import CourseDetailSerializer, ModuleDetailSerializer
+
+PACK_FORMAT = 1
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class PackNotBuilt(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'This course pack has not been built yet, please retry later.'
+    default_code = 'pack_not_built'
+    wait = 60
+
+
+def pack_root():
+    return Path(settings.COURSE_PACK_ROOT)
+
+
+def pack_path(pack):
+    return pack_root() / pack.file_name
+
+
+def is_built(pack):
+    return pack is not None and pack_path(pack).exists()
+
+
+def is_fresh(pack, course):
+    return is_built(pack) and pack.content_updated_at == course.updated_at
+
+
+def render_pack(course):
+    """Return the gzip-compressed pack body for ``course``."""
+    prefetch_related_objects([course], Prefetch(
+        'modules', queryset=published_modules().prefetch_related(*module_content_prefetches())
+    ))
+    modules = course.modules.all()
+    payload = {
+        'format': PACK_FORMAT,
+        'content_updated_at': course.updated_at,
+        'course': CourseDetailSerializer(course).data,
+        'modules': [ModuleDetailSerializer(module).data for module in modules],
+    }
+    body = FastJSONRenderer().render(payload)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def build_pack(course):
+    """Write ``course``'s pack to disk and record it; returns the CoursePack.
+
+    The file is written under a temporary name and renamed into place, so
+    readers never see a partial pack. The file of the pack it replaces is
+    deleted.
+    """
+    previous = CoursePack.objects.filter(course=course).values_list('file_name', flat=True).first()
+    data = render_pack(course)
+    sha256 = hashlib.sha256(data).hexdigest()
+    file_name = f'{course.slug}-{sha256[:16]}.json.gz'
+    root = pack_root()
+    root.mkdir(parents=True, exist_ok=True)
+    if not (root / file_name).exists():
+        fd, temp_name = tempfile.mkstemp(dir=root, prefix=f'.{course.slug}-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(temp_name, 0o644)
+            os.replace(temp_name, root / file_name)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+    pack, _ = CoursePack.objects.update_or_create(
+        course=course,
+        defaults={
+            'file_name': file_name,
+            'sha256': sha256,
+            'size': len(data),
+            'content_updated_at': course.updated_at,
+        },
+    )
+    if previous and previous != file_name:
+        (root / previous).unlink(missing_ok=True)
+    return pack
+
+
+def ensure_pack(course, force=False):
+    """Return a fresh pack for ``course``, building it if content changed."""
+    pack = CoursePack.objects.filter(course=course).first()
+    if force or not is_fresh(pack, course):
+        try:
+            pack = build_pack(course)
+        except IntegrityError:
+            # Another request created the row first; its file is identical.
+            pack = CoursePack.objects.get(course=course)
+    return pack
+
+
+def prune_packs():
+    """Delete packs of unpublished courses and files no pack row points to."""
+    CoursePack.objects.filter(course__is_published=False).delete()
+    keep = set(CoursePack.objects.values_list('file_name', flat=True))
+    removed = 0
+    root = pack_root()
+    if root.exists():
+        for path in root.glob('*.json.gz'):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
+                removed += 1
+    return removed
+
+
+def parse_range(header, size):
+    """Parse a single ``bytes=`` range into inclusive ``(start, end)`` offsets.
+
+    Returns ``None`` when the header is absent, invalid or asks for several
+    ranges (the whole file is served instead), and raises ``ValueError``
+    when the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if (not first and not last) or (first and last and int(last) < int(first)):
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError('empty suffix range')
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise ValueError('range not satisfiable')
+    return start, end
+
+
+def iter_file_range(path, start, end):
+    """Yield bytes ``start``..``end`` (inclusive) of ``path`` in chunks."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
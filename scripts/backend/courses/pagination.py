@@ -0,0 +1,98 @@
+"""Keyset (cursor) pagination for list endpoints."""
+import base64
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Forward cursor pagination over a unique, ascending ordering key.
+
+    Views declare the key as ``keyset_ordering`` (default ``('id',)``); its
+    last field must be unique. Each page is a ``WHERE key > cursor`` range
+    read, so cost depends only on the page size, never on how deep the
+    client has paged. Page size comes from ``?limit=``, capped at
+    ``API_MAX_PAGE_SIZE``.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = tuple(getattr(view, 'keyset_ordering', ('id',)))
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            try:
+                queryset = queryset.filter(self.after(cursor))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = list(queryset[:self.page_size + 1])
+        self.next_key = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            self.next_key = [self.key_value(rows[-1], field) for field in self.ordering]
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        default = settings.REST_FRAMEWORK.get('PAGE_SIZE') or 100
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, default))
+        except ValueError:
+            size = default
+        return max(1, min(size, settings.API_MAX_PAGE_SIZE))
+
+    def get_next_link(self):
+        if self.next_key is None:
+            return None
+        cursor = base64.urlsafe_b64encode(json.dumps(self.next_key).encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def after(self, cursor):
+        """Rows whose key sorts strictly after ``cursor``."""
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            equal = dict(zip(self.ordering[:index], cursor[:index]))
+            condition |= Q(**equal, **{f'{field}__gt': cursor[index]})
+        return condition
+
+    @staticmethod
+    def key_value(row, field):
+        value = getattr(row, field)
+        return value.isoformat() if isinstance(value, datetime) else value
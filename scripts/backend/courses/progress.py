@@ -0,0 +1,158 @@
+"""Progress write operations shared by the progress endpoints."""
+from django.db import transaction
+from django.utils import timezone
+
+from .analytics import FunnelChanges, progress_state, record_funnel_events
+from .answers import UnknownQuestion, answer_rows, module_questions, save_answers
+from .models import Course, CourseCompletion, Module, ProgressSyncOperation, UserProgress
+
+
+def published_module_ids(course_id):
+    """IDs of a course's published modules in bitmap position order."""
+    return list(Module.objects.filter(
+        course_id=course_id, is_published=True
+    ).order_by('order', 'id').values_list('id', flat=True))
+
+
+def completion_bits(module_ids, completed_ids):
+    """Bitmap of ``completed_ids`` over the module positions in ``module_ids``."""
+    return sum(
+        1 << position for position, module_id in enumerate(module_ids)
+        if module_id in completed_ids
+    )
+
+
+def rebuild_course_completion(user, course):
+    """Rebuild ``user``'s completion bitmap for ``course`` from UserProgress."""
+    module_ids = published_module_ids(course.pk)
+    completed_ids = set(UserProgress.objects.filter(
+        user=user, module_id__in=module_ids, completed=True
+    ).values_list('module_id', flat=True))
+
+    completion = CourseCompletion(module_count=len(module_ids))
+    completion.set_bits(completion_bits(module_ids, completed_ids))
+    completion, _ = CourseCompletion.objects.update_or_create(
+        user=user,
+        course=course,
+        defaults={
+            'bitmap': completion.bitmap,
+            'module_count': completion.module_count,
+            'completed_count': completion.completed_count,
+            'layout_at': course.updated_at,
+        },
+    )
+    return completion
+
+
+def record_module_completion(user, module):
+    """Set ``module``'s bit in ``user``'s completion bitmap.
+
+    Must run inside the transaction that marks the progress row complete.
+    A missing or stale bitmap is rebuilt from UserProgress instead.
+    """
+    completion = CourseCompletion.objects.select_for_update().select_related(
+        'course'
+    ).filter(user=user, course_id=module.course_id).first()
+    if completion is None or completion.is_stale:
+        course = completion.course if completion else Course.objects.get(pk=module.course_id)
+        return rebuild_course_completion(user, course)
+
+    module_ids = published_module_ids(module.course_id)
+    if module.pk in module_ids:
+        completion.set_bits(completion.bits | 1 << module_ids.index(module.pk))
+        completion.save(update_fields=['bitmap', 'completed_count', 'updated_at'])
+    return completion
+
+
+def apply_sync_operations(user, operations):
+    """Apply a batch of offline progress operations in one transaction.
+
+    Operations whose client ID was already applied for ``user`` are skipped,
+    so a client can resend a batch after a dropped connection. Completions
+    keep the earliest completion time and reflection answers are upserted
+    per question, later operations winning. Returns the applied, skipped and failed operation IDs
+    along with the slugs of every course the batch referenced.
+    """
+    now = timezone.now()
+    applied, skipped, errors = [], [], []
+    completed_courses = set()
+    course_slugs = {op['course_slug'] for op in operations}
+
+    with transaction.atomic():
+        seen = set(ProgressSyncOperation.objects.filter(
+            user=user, client_id__in=[op['id'] for op in operations]
+        ).values_list('client_id', flat=True))
+
+        modules = {
+            (course_slug, slug): pk
+            for pk, slug, course_slug in Module.objects.filter(
+                course__slug__in=course_slugs,
+                slug__in={op['module_slug'] for op in operations},
+            ).values_list('id', 'slug', 'course__slug')
+        }
+        rows = {
+            progress.module_id: progress
+            for progress in UserProgress.objects.select_for_update().filter(
+                user=user, module_id__in=modules.values()
+            )
+        }
+        questions = module_questions(modules.values())
+        before = {module_id: progress_state(progress) for module_id, progress in rows.items()}
+        answers = {}
+        changed = {}
+
+        for op in operations:
+            if op['id'] in seen:
+                skipped.append(op['id'])
+                continue
+            module_id = modules.get((op['course_slug'], op['module_slug']))
+            if module_id is None:
+                errors.append({'id': op['id'], 'error': 'Module not found.'})
+                continue
+            try:
+                op_answers = answer_rows(user, questions.get(module_id, []), op['reflection_answers'])
+            except UnknownQuestion as exc:
+                errors.append({'id': op['id'], 'error': str(exc)})
+                continue
+            seen.add(op['id'])
+
+            progress = rows.setdefault(module_id, UserProgress(user=user, module_id=module_id))
+            answers.update((answer.question_id, answer) for answer in op_answers)
+            if op['type'] == 'complete':
+                completed_at = min(op.get('completed_at') or now, now)
+                if not progress.completed or progress.completed_at is None or completed_at < progress.completed_at:
+                    progress.completed_at = completed_at
+                progress.completed = True
+                completed_courses.add(op['course_slug'])
+            progress.updated_at = now
+            changed[module_id] = progress
+            applied.append(op['id'])
+
+        fields = ['completed', 'completed_at', 'updated_at']
+        UserProgress.objects.bulk_update(
+            [progress for progress in changed.values() if progress.pk], fields
+        )
+        UserProgress.objects.bulk_create(
+            [progress for progress in changed.values() if not progress.pk],
+            update_conflicts=True,
+            unique_fields=['user', 'module'],
+            update_fields=fields,
+        )
+        save_answers(list(answers.values()))
+        ProgressSyncOperation.objects.bulk_create(
+            [ProgressSyncOperation(user=user, client_id=client_id) for client_id in applied],
+            ignore_conflicts=True,
+        )
+        for course in Course.objects.filter(slug__in=completed_courses):
+            rebuild_course_completion(user, course)
+        funnel = FunnelChanges()
+        for module_id, progress in changed.items():
+            funnel.change(module_id, before.get(module_id), progress_state(progress, now))
+        record_funnel_events(funnel)
+
+    return {
+        'applied': applied,
+        'skipped': skipped,
+        'errors': errors,
+        'course_slugs': course_slugs,
+    }
@@ -0,0 +1,31 @@
+"""Shared query building blocks for course content."""
+from django.db.models import Prefetch
+
+from .models import ContentExample, ContentPoint, ContentSection, Module, ReflectionQuestion
+
+
+def published_modules():
+    """Published modules in display order."""
+    return Module.objects.filter(is_published=True).order_by('order', 'id')
+
+
+def module_content_prefetches():
+    """Prefetch plan for everything ModuleDetailSerializer walks.
+
+    Loads a module's sections, their points and examples, and its
+    reflection questions in one query per relation, so the cost of a
+    module page does not grow with its number of sections.
+    """
+    return [
+        Prefetch(
+            'content_sections',
+            queryset=ContentSection.objects.order_by('order', 'id').prefetch_related(
+                Prefetch('points', queryset=ContentPoint.objects.order_by('order', 'id')),
+                Prefetch('examples', queryset=ContentExample.objects.order_by('order', 'id')),
+            ),
+        ),
+        Prefetch(
+            'reflection_questions',
+            queryset=ReflectionQuestion.objects.order_by('order', 'id'),
+        ),
+    ]
@@ -0,0 +1,177 @@
+"""Full-text search over course content.
+
+Every searchable piece of content is mirrored into a
+:class:`~courses.models.SearchDocument` row, and the configured backend
+indexes that table. The SQLite backend uses an external-content FTS5 table
+kept in sync by triggers; the Postgres backend uses a generated, weighted
+``tsvector`` column with a GIN index. Both are created by migration 0007.
+Select one with the ``SEARCH_BACKEND`` setting.
+"""
+import re
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection, connections, router, transaction
+from django.utils.module_loading import import_string
+
+from .models import ContentExample, ContentPoint, ContentSection, Module, ReflectionQuestion, SearchDocument
+
+# ``(module_ids, callback)`` of the latest schedule_reindex() commit
+# callback; the set only grows while the callback is still waiting.
+_pending_reindex = ContextVar('pending_search_reindex', default=None)
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_END = '</mark>'
+
+
+def module_documents(module_ids):
+    """Build the search documents for the given modules (unsaved)."""
+    modules = Module.objects.filter(pk__in=module_ids).select_related('course')
+    slugs = {module.pk: (module.course.slug, module.slug) for module in modules}
+
+    def document(kind, pk, module_id, title, body):
+        course_slug, module_slug = slugs[module_id]
+        return SearchDocument(
+            key=f'{kind}:{pk}', kind=kind, module_id=module_id,
+            course_slug=course_slug, module_slug=module_slug,
+            title=title or '', body=body or '',
+        )
+
+    documents = [
+        document('module', module.pk, module.pk, module.title,
+                 '\n'.join(filter(None, [module.objective, module.capstone_task])))
+        for module in modules
+    ]
+    sections = {}
+    for section in ContentSection.objects.filter(module_id__in=slugs):
+        sections[section.pk] = section
+        documents.append(document('section', section.pk, section.module_id, section.title, section.description))
+    for kind, model in (('point', ContentPoint), ('example', ContentExample)):
+        for row in model.objects.filter(section_id__in=sections):
+            section = sections[row.section_id]
+            documents.append(document(kind, row.pk, section.module_id, section.title, row.text))
+    for question in ReflectionQuestion.objects.filter(module_id__in=slugs):
+        documents.append(document('question', question.pk, question.module_id, '', question.question))
+    return documents
+
+
+def reindex_modules(module_ids):
+    """Replace the search documents of the given modules.
+
+    Runs in one transaction holding the modules' row locks, so searches
+    never see a module without documents and concurrent reindexes of the
+    same module take turns instead of colliding on ``key``.
+    """
+    module_ids = sorted(module_ids)
+    with transaction.atomic():
+        list(Module.objects.select_for_update().filter(pk__in=module_ids).order_by('pk').values_list('pk'))
+        SearchDocument.objects.filter(module_id__in=module_ids).delete()
+        SearchDocument.objects.bulk_create(module_documents(module_ids), batch_size=500)
+
+
+def schedule_reindex(module_ids):
+    """Reindex ``module_ids`` once the current transaction commits.
+
+    Modules changed in one transaction are collected and reindexed
+    together by one commit callback, so saving many rows of a module
+    reindexes it once. A rollback discards the callback along with the
+    modules collected for it.
+    """
+    pending = _pending_reindex.get()
+    if pending is not None and awaiting_commit(pending[1]):
+        pending[0].update(module_ids)
+        return
+    module_ids = set(module_ids)
+
+    def callback():
+        reindex_modules(module_ids)
+
+    _pending_reindex.set((module_ids, callback))
+    transaction.on_commit(callback)
+
+
+def awaiting_commit(callback):
+    return any(func is callback for _, func, _ in transaction.get_connection().run_on_commit)
+
+
+class SearchBackend:
+    """Ranks SearchDocument rows for a free-text query."""
+
+    def search(self, query, limit):
+        """Return ranked hits for published content as a list of dicts."""
+        raise NotImplementedError
+
+    def rebuild(self):
+        """Regenerate every search document."""
+        SearchDocument.objects.all().delete()
+        module_ids = list(Module.objects.values_list('id', flat=True))
+        for start in range(0, len(module_ids), 100):
+            SearchDocument.objects.bulk_create(module_documents(module_ids[start:start + 100]), batch_size=500)
+
+    def hits(self, sql, params):
+        with connections[router.db_for_read(SearchDocument)].cursor() as cursor:
+            cursor.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    table = 'courses_searchdocument_fts'
+
+    def search(self, query, limit):
+        match = fts5_query(query)
+        if not match:
+            return []
+        return self.hits(f'''
+            SELECT d.kind, d.course_slug, d.module_slug,
+                   highlight({self.table}, 0, %s, %s) AS title,
+                   snippet({self.table}, 1, %s, %s, '…', 16) AS snippet,
+                   -bm25({self.table}, 4.0, 1.0) AS score
+            FROM {self.table}
+            JOIN courses_searchdocument d ON d.id = {self.table}.rowid
+            JOIN courses_module m ON m.id = d.module_id
+            JOIN courses_course c ON c.id = m.course_id
+            WHERE {self.table} MATCH %s AND m.is_published AND c.is_published
+            ORDER BY bm25({self.table}, 4.0, 1.0)
+            LIMIT %s
+        ''', [HIGHLIGHT_START, HIGHLIGHT_END, HIGHLIGHT_START, HIGHLIGHT_END, match, limit])
+
+    def rebuild(self):
+        super().rebuild()
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')")
+
+
+class PostgresSearchBackend(SearchBackend):
+    config = 'english'
+
+    def search(self, query, limit):
+        options = f'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxFragments=1, MaxWords=32'
+        return self.hits('''
+            WITH q AS (SELECT websearch_to_tsquery(%s::regconfig, %s) AS query)
+            SELECT d.kind, d.course_slug, d.module_slug,
+                   ts_headline(%s::regconfig, d.title, q.query, %s) AS title,
+                   ts_headline(%s::regconfig, d.body, q.query, %s) AS snippet,
+                   ts_rank(d.search_vector, q.query) AS score
+            FROM courses_searchdocument d
+            CROSS JOIN q
+            JOIN courses_module m ON m.id = d.module_id
+            JOIN courses_course c ON c.id = m.course_id
+            WHERE d.search_vector @@ q.query AND m.is_published AND c.is_published
+            ORDER BY score DESC
+            LIMIT %s
+        ''', [self.config, query, self.config, options, self.config, options, limit])
+
+
+def fts5_query(query):
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix."""
+    words = re.findall(r'\w+', query)
+    if not words:
+        return ''
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def get_search_backend():
+    return import_string(settings.SEARCH_BACKEND)()
@@ -1,24 +1,28 @@
 """Serializers for course API."""
+from django.conf import settings
 from rest_framework import serializers
+
+from bfpa_backend.fieldsets import SparseFieldsMixin
+
 from .models import (
     Course, Module, ContentSection, ContentPoint, 
-    ContentExample, ReflectionQuestion, UserProgress
+    ContentExample, ReflectionQuestion, UserProgress, CourseCompletion
 )
 
 
-class ContentPointSerializer(serializers.ModelSerializer):
+class ContentPointSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ContentPoint
         fields = ['id', 'text', 'order']
 
 
-class ContentExampleSerializer(serializers.ModelSerializer):
+class ContentExampleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ContentExample
         fields = ['id', 'text', 'order']
 
 
-class ContentSectionSerializer(serializers.ModelSerializer):
+class ContentSectionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     points = ContentPointSerializer(many=True, read_only=True)
     examples = ContentExampleSerializer(many=True, read_only=True)
 
@@ -27,20 +31,20 @@ class ContentSectionSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'description', 'order', 'points', 'examples']
 
 
-class ReflectionQuestionSerializer(serializers.ModelSerializer):
+class ReflectionQuestionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ReflectionQuestion
         fields = ['id', 'question', 'order']
 
 
-class ModuleListSerializer(serializers.ModelSerializer):
+class ModuleListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight module serializer for list views."""
     class Meta:
         model = Module
         fields = ['id', 'slug', 'title', 'objective', 'order', 'capstone_task']
 
 
-class ModuleDetailSerializer(serializers.ModelSerializer):
+class ModuleDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full module serializer with content."""
     content_sections = ContentSectionSerializer(many=True, read_only=True)
     reflection_questions = ReflectionQuestionSerializer(many=True, read_only=True)
@@ -53,19 +57,23 @@ class ModuleDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight course serializer for list views."""
     module_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Course
         fields = ['id', 'slug', 'title', 'description', 'icon', 'color', 'module_count']
+        field_columns = {'module_count': []}
 
     def get_module_count(self, obj):
-        return obj.modules.filter(is_published=True).count()
+        count = getattr(obj, 'module_count', None)
+        if count is None:
+            count = obj.modules.filter(is_published=True).count()
+        return count
 
 
-class CourseDetailSerializer(serializers.ModelSerializer):
+class CourseDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full course serializer with modules."""
     modules = ModuleListSerializer(many=True, read_only=True)
 
@@ -74,10 +82,62 @@ class CourseDetailSerializer(serializers.ModelSerializer):
         fields = ['id', 'slug', 'title', 'description', 'icon', 'color', 'modules']
 
 
-class UserProgressSerializer(serializers.ModelSerializer):
+class UserProgressSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     module_slug = serializers.CharField(source='module.slug', read_only=True)
     course_slug = serializers.CharField(source='module.course.slug', read_only=True)
 
     class Meta:
         model = UserProgress
-        fields = ['id', 'module_slug', 'course_slug', 'completed', 'completed_at', 'reflection_answers']
+        fields = ['id', 'module_slug', 'course_slug', 'completed', 'completed_at']
+
+
+class UserProgressWithAnswersSerializer(UserProgressSerializer):
+    """Progress plus reflection answers, read from the ``reflection_answers`` context.
+
+    The view loads answers for all rows at once (see courses.answers); the
+    context maps ``(user_id, module_id)`` to ``{position: text}``.
+    """
+    reflection_answers = serializers.SerializerMethodField()
+
+    class Meta(UserProgressSerializer.Meta):
+        fields = UserProgressSerializer.Meta.fields + ['reflection_answers']
+        field_columns = {'reflection_answers': ['user', 'module']}
+
+    def get_reflection_answers(self, obj):
+        return self.context['reflection_answers'].get((obj.user_id, obj.module_id), {})
+
+
+class CourseCompletionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    course_slug = serializers.CharField(source='course.slug', read_only=True)
+    percentage = serializers.IntegerField(read_only=True)
+    completed_positions = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+    next_position = serializers.IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = CourseCompletion
+        fields = [
+            'course_slug', 'module_count', 'completed_count', 'percentage',
+            'completed_positions', 'next_position'
+        ]
+
+
+class SyncOperationSerializer(serializers.Serializer):
+    """A single offline progress operation identified by a client-generated ID."""
+    TYPE_CHOICES = ['complete', 'reflection']
+
+    id = serializers.CharField(max_length=64)
+    type = serializers.ChoiceField(choices=TYPE_CHOICES)
+    course_slug = serializers.SlugField()
+    module_slug = serializers.SlugField()
+    reflection_answers = serializers.DictField(required=False, default=dict)
+    completed_at = serializers.DateTimeField(required=False)
+
+
+class ProgressSyncSerializer(serializers.Serializer):
+    operations = SyncOperationSerializer(many=True)
+
+    def validate_operations(self, value):
+        limit = settings.PROGRESS_SYNC_MAX_OPERATIONS
+        if len(value) > limit:
+            raise serializers.ValidationError(f'At most {limit} operations per sync.')
+        return value
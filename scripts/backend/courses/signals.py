@@ -0,0 +1,131 @@
+"""Signal handlers for course content changes."""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from .cache import bump_content_version
+from .changes import descendants, record_changes
+from .search import schedule_reindex
+from .models import (
+    Course, Module, ContentSection, ContentPoint,
+    ContentExample, ReflectionQuestion
+)
+
+CONTENT_MODELS = (
+    Course, Module, ContentSection, ContentPoint,
+    ContentExample, ReflectionQuestion,
+)
+
+# Change log entries collected inside bulk_content_changes(), else None.
+_bulk_changes = ContextVar('bulk_content_changes', default=None)
+
+
+@contextmanager
+def bulk_content_changes():
+    """Skip the per-row handlers below for the duration of the block.
+
+    For bulk writers that bump timestamps, module counts, search documents
+    and the content version once themselves afterwards. Change log entries
+    are still collected, and written in one batch when the block exits.
+    """
+    pending = []
+    token = _bulk_changes.set(pending)
+    try:
+        yield
+    finally:
+        _bulk_changes.reset(token)
+    record_changes(pending)
+
+
+def touch_content_tree(instance):
+    """Bump ``updated_at`` on the module and course that own ``instance``.
+
+    Sections, points, examples and questions carry no timestamp of their
+    own, so their changes are recorded on their ancestors. Module changes
+    also refresh the course's published module count. Uses ``update()`` so
+    no further signals fire.
+    """
+    now = timezone.now()
+    if isinstance(instance, Course):
+        return
+    if isinstance(instance, Module):
+        course_ids = {instance.course_id, getattr(instance, '_previous_course_id', None)}
+        courses = Course.objects.filter(pk__in=course_ids - {None})
+        courses.update(updated_at=now)
+        courses.refresh_published_module_counts()
+        return
+    if isinstance(instance, (ContentSection, ReflectionQuestion)):
+        modules = Module.objects.filter(pk=instance.module_id)
+        courses = Course.objects.filter(modules=instance.module_id)
+    else:
+        modules = Module.objects.filter(content_sections=instance.section_id)
+        courses = Course.objects.filter(modules__content_sections=instance.section_id)
+    modules.update(updated_at=now)
+    courses.update(updated_at=now)
+
+
+def remember_stored_state(sender, instance, raw=False, **kwargs):
+    """Remember a course's or module's stored course and publication state.
+
+    Moving a module refreshes the module counts of both courses, and
+    (un)publishing logs the rows below it whose visibility changed.
+    """
+    if raw or instance.pk is None or _bulk_changes.get() is not None:
+        return
+    if isinstance(instance, Module):
+        instance._previous_course_id, instance._previous_published = Module.objects.filter(
+            pk=instance.pk
+        ).values_list('course_id', 'is_published').first() or (None, None)
+    else:
+        instance._previous_published = Course.objects.filter(pk=instance.pk).values_list(
+            'is_published', flat=True
+        ).first()
+
+
+def search_module_ids(instance):
+    """IDs of the modules whose search documents cover ``instance``."""
+    if isinstance(instance, Course):
+        return list(instance.modules.values_list('id', flat=True))
+    if isinstance(instance, Module):
+        return [instance.pk]
+    if isinstance(instance, (ContentSection, ReflectionQuestion)):
+        return [instance.module_id]
+    return list(ContentSection.objects.filter(pk=instance.section_id).values_list('module_id', flat=True))
+
+
+def log_content_change(sender, instance, raw=False, created=False, signal=None, **kwargs):
+    """Append the change to the content change log."""
+    if raw:
+        return
+    action = 'delete' if signal is post_delete else 'insert' if created else 'update'
+    changes = [(sender, instance.pk, action)]
+    pending = _bulk_changes.get()
+    if pending is not None:
+        pending.extend(changes)
+        return
+    previous = getattr(instance, '_previous_published', None)
+    if action == 'update' and previous is not None and previous != instance.is_published:
+        scope = {'course_ids': [instance.pk]} if sender is Course else {'module_ids': [instance.pk]}
+        changes += [(model, pk, 'update') for model, pk in descendants(**scope)]
+    record_changes(changes)
+
+
+def content_changed(sender, instance, raw=False, **kwargs):
+    """Record a content change on its ancestors, reindex it and bump the content version."""
+    if raw or _bulk_changes.get() is not None:
+        return
+    touch_content_tree(instance)
+    schedule_reindex(search_module_ids(instance))
+    transaction.on_commit(bump_content_version)
+
+
+for model in (Course, Module):
+    pre_save.connect(remember_stored_state, sender=model, dispatch_uid=f'remember_state_{model.__name__}')
+for model in CONTENT_MODELS:
+    post_save.connect(log_content_change, sender=model, dispatch_uid=f'content_logged_{model.__name__}')
+    post_delete.connect(log_content_change, sender=model, dispatch_uid=f'content_delete_logged_{model.__name__}')
+    post_save.connect(content_changed, sender=model, dispatch_uid=f'content_saved_{model.__name__}')
+    post_delete.connect(content_changed, sender=model, dispatch_uid=f'content_deleted_{model.__name__}')
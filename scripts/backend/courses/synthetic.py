@@ -0,0 +1,352 @@
+"""Deterministic synthetic data for scaling tests.
+
+Everything is derived from a seed: the same seed and sizes always produce
+the same courses, learners and progress. Rows are written with batched
+``bulk_create``; the denormalized tables that signals and views normally
+maintain (published module counts, completion bitmaps, funnels, search
+documents, the change log, the content version) are filled in afterwards.
+"""
+import math
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from users.models import UserProfile
+
+from .analytics import rebuild_funnels
+from .cache import bump_content_version
+from .answers import encode_answer, module_questions
+from .changes import descendants, record_changes
+from .models import (
+    ContentExample, ContentPoint, ContentSection, Course, CourseCompletion, Module,
+    ReflectionAnswer, ReflectionQuestion, UserProgress,
+)
+from .search import reindex_modules
+from .signals import bulk_content_changes
+
+WORDS = (
+    'budget allocation appropriation audit revenue expenditure deficit debt fiscal '
+    'policy transparency accountability oversight procurement tax subsidy transfer '
+    'county treasury ministry program outcome indicator citizen participation '
+    'hearing parliament committee report variance forecast borrowing grant donor '
+    'health education water infrastructure agriculture gender equity climate '
+    'resilience capital recurrent wage bill pension arrears ceiling framework '
+    'medium term strategy baseline target monitoring evaluation disclosure '
+    'timeline calendar approval execution absorption efficiency leakage risk'
+).split()
+COUNTRIES = [
+    'Kenya', 'Uganda', 'Tanzania', 'Rwanda', 'Nigeria', 'Ghana', 'South Africa',
+    'Zambia', 'Malawi', 'Ethiopia', 'Senegal', 'Cameroon',
+]
+ROLE_WEIGHTS = {'professional': 40, 'student': 30, 'educator': 10, 'ngo': 15, 'other': 5}
+COLORS = [value for value, _ in Course.COLOR_CHOICES]
+ICONS = ['BookOpen', 'Landmark', 'PiggyBank', 'Scale', 'FileText', 'Users', 'TrendingUp']
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let ``bulk_create`` keep the ``auto_now``/``auto_now_add`` values we set.
+
+    Mutates field definitions for the duration of the block, so only use it
+    from single-purpose processes such as management commands.
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class SyntheticDataGenerator:
+    """Generate courses, learners and progress at a configurable scale."""
+
+    def __init__(self, seed=0, courses=1000, modules_per_course=8, users=100000,
+                 courses_per_user=3.0, start=None, days=365, prefix='synthetic',
+                 password='synthetic-password', batch_size=5000, search=True, log=None):
+        self.seed = seed
+        self.course_total = courses
+        self.modules_per_course = modules_per_course
+        self.user_total = users
+        self.courses_per_user = courses_per_user
+        self.start = start or datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+        self.span = timedelta(days=days)
+        self.end = self.start + self.span
+        self.prefix = prefix
+        self.password = password
+        self.batch_size = batch_size
+        self.search = search
+        self.log = log or (lambda message: None)
+        self.stats = {}
+
+    def rng(self, stream):
+        """Independent random stream per phase, so changing one size keeps the rest stable."""
+        return random.Random(f'{self.seed}:{stream}')
+
+    def exists(self):
+        return (
+            Course.objects.filter(slug__startswith=f'{self.prefix}-').exists()
+            or User.objects.filter(username__startswith=f'{self.prefix}-').exists()
+        )
+
+    def delete_existing(self):
+        """Remove data from a previous run with the same prefix (cascades progress)."""
+        with transaction.atomic(), bulk_content_changes():
+            User.objects.filter(username__startswith=f'{self.prefix}-').delete()
+            Course.objects.filter(slug__startswith=f'{self.prefix}-').delete()
+            rebuild_funnels(batch_size=self.batch_size)
+        bump_content_version()
+
+    def run(self):
+        with explicit_timestamps(Course, Module, UserProfile, UserProgress, ReflectionAnswer, CourseCompletion):
+            layout = self.generate_content()
+            users = self.generate_users()
+            self.generate_progress(layout, users)
+        self.finish(layout)
+        return self.stats
+
+    def bulk_create(self, rows):
+        """Insert model instances from any iterable, batching per model.
+
+        Rows of different models may be interleaved; each model's rows are
+        written ``batch_size`` at a time, one transaction per batch.
+        """
+        pending = {}
+        for row in rows:
+            batch = pending.setdefault(type(row), [])
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self.flush(type(row), batch)
+                pending[type(row)] = []
+        for model, batch in pending.items():
+            self.flush(model, batch)
+
+    def flush(self, model, batch):
+        if not batch:
+            return
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=self.batch_size)
+        self.stats[model._meta.label] = self.stats.get(model._meta.label, 0) + len(batch)
+
+    @staticmethod
+    def sentence(rng, low, high):
+        return ' '.join(rng.choices(WORDS, k=rng.randint(low, high))).capitalize()
+
+    def generate_content(self):
+        """Create courses and their modules, sections, points, examples and questions.
+
+        Returns ``{course_id: (updated_at, [(module_id, question_ids), ...])}``
+        for the published modules of published courses, in bitmap order.
+        """
+        rng = self.rng('content')
+        courses = []
+        for n in range(self.course_total):
+            title = self.sentence(rng, 2, 5).title()
+            slug = f'{self.prefix}-{n:05d}-' + '-'.join(title.lower().split()[:3])
+            courses.append(Course(
+                slug=slug[:100], title=title, description=self.sentence(rng, 12, 30) + '.',
+                icon=rng.choice(ICONS), color=rng.choice(COLORS), order=1000 + n,
+                is_published=rng.random() > 0.03, created_at=self.start, updated_at=self.start,
+            ))
+        self.bulk_create(courses)
+        courses = list(Course.objects.filter(slug__startswith=f'{self.prefix}-').order_by('order'))
+        self.log(f'{len(courses)} courses')
+
+        modules = []
+        for course in courses:
+            count = max(1, round(rng.gauss(self.modules_per_course, self.modules_per_course / 3)))
+            for i in range(count):
+                title = self.sentence(rng, 2, 6).title()
+                modules.append(Module(
+                    course=course, slug=f'module-{i + 1}', title=title,
+                    objective=self.sentence(rng, 10, 25) + '.', order=i + 1,
+                    capstone_task=self.sentence(rng, 15, 40) + '.' if i == count - 1 else None,
+                    is_published=rng.random() > 0.05, created_at=self.start, updated_at=self.start,
+                ))
+        self.bulk_create(modules)
+        modules = list(
+            Module.objects.filter(course__slug__startswith=f'{self.prefix}-')
+            .order_by('course_id', 'order', 'id')
+            .values_list('id', 'course_id', 'is_published')
+        )
+        self.log(f'{len(modules)} modules')
+
+        def sections():
+            for module_id, _, _ in modules:
+                for order in range(1, rng.randint(3, 8) + 1):
+                    yield ContentSection(
+                        module_id=module_id, title=self.sentence(rng, 2, 6).title(),
+                        description=self.sentence(rng, 8, 20) + '.' if rng.random() < 0.7 else None,
+                        order=order,
+                    )
+        self.bulk_create(sections())
+
+        def children():
+            section_ids = ContentSection.objects.filter(
+                module__course__slug__startswith=f'{self.prefix}-'
+            ).order_by('id').values_list('id', flat=True)
+            for section_id in section_ids.iterator(chunk_size=self.batch_size):
+                for order in range(1, rng.randint(2, 6) + 1):
+                    yield ContentPoint(section_id=section_id, text=self.sentence(rng, 8, 24) + '.', order=order)
+                for order in range(1, rng.choice((0, 0, 1, 1, 2)) + 1):
+                    yield ContentExample(section_id=section_id, text=self.sentence(rng, 12, 30) + '.', order=order)
+
+        self.bulk_create(children())
+
+        layout = {course.pk: (course.updated_at, []) for course in courses if course.is_published}
+        questions = []
+        for module_id, course_id, is_published in modules:
+            count = rng.randint(1, 3)
+            questions.extend(
+                ReflectionQuestion(module_id=module_id, question=self.sentence(rng, 8, 18) + '?', order=order)
+                for order in range(1, count + 1)
+            )
+            if is_published and course_id in layout:
+                layout[course_id][1].append(module_id)
+        self.bulk_create(questions)
+        question_ids = module_questions(
+            Module.objects.filter(course__slug__startswith=f'{self.prefix}-').values('pk')
+        )
+        for _, course_modules in layout.values():
+            course_modules[:] = [(module_id, question_ids.get(module_id, [])) for module_id in course_modules]
+        self.log('content sections, points, examples and questions')
+        return layout
+
+    def generate_users(self):
+        """Create learners sharing one password hash; returns ``[(id, date_joined)]``."""
+        rng = self.rng('users')
+        password = make_password(self.password)
+        roles, role_weights = zip(*ROLE_WEIGHTS.items())
+        organizations = [f'{self.sentence(rng, 1, 3).title()} Institute' for _ in range(500)]
+        org_weights = list(accumulate_zipf(len(organizations), 1.2))
+        joined = [
+            # Signups grow over the period, so later dates are more likely.
+            self.start + self.span * math.sqrt(rng.random())
+            for _ in range(self.user_total)
+        ]
+        self.bulk_create((
+            User(
+                username=f'{self.prefix}-{n:07d}', email=f'{self.prefix}-{n:07d}@example.com',
+                password=password, first_name=rng.choice(WORDS).title(),
+                last_name=rng.choice(WORDS).title(), date_joined=joined[n],
+            )
+            for n in range(self.user_total)
+        ))
+        users = list(
+            User.objects.filter(username__startswith=f'{self.prefix}-').order_by('username')
+            .values_list('id', 'date_joined')
+        )
+        self.bulk_create((
+            UserProfile(
+                user_id=user_id, role=rng.choices(roles, role_weights)[0],
+                organization=rng.choices(organizations, cum_weights=org_weights)[0] if rng.random() < 0.8 else '',
+                country=rng.choice(COUNTRIES), created_at=date_joined, updated_at=date_joined,
+            )
+            for user_id, date_joined in users
+        ))
+        self.log(f'{len(users)} users')
+        return users
+
+    def generate_progress(self, layout, users):
+        """Walk each learner through a few popular courses with realistic drop-off.
+
+        Course popularity follows a Zipf curve. Learners go through a course in
+        module order. Each later module is less likely to be finished, and the
+        module where a learner stops is usually left started but incomplete.
+        """
+        rng = self.rng('progress')
+        course_ids = list(layout)
+        if not course_ids:
+            return
+        rng.shuffle(course_ids)
+        popularity = list(accumulate_zipf(len(course_ids), 1.1))
+
+        def progress_rows():
+            for user_id, date_joined in users:
+                enrollments = min(len(course_ids), 1 + int(rng.expovariate(1 / max(self.courses_per_user - 1, 0.01))))
+                chosen = set(rng.choices(course_ids, cum_weights=popularity, k=enrollments))
+                for course_id in sorted(chosen):
+                    updated_at, modules = layout[course_id]
+                    if not modules:
+                        continue
+                    when = date_joined + timedelta(hours=rng.expovariate(1 / 72))
+                    finished = 0
+                    keep_going = rng.uniform(0.75, 0.97)
+                    for module_id, question_ids in modules:
+                        if when >= self.end:
+                            break
+                        started = when
+                        done = rng.random() < keep_going
+                        when = started + timedelta(minutes=rng.expovariate(1 / 90))
+                        if done and when >= self.end:
+                            done = False
+                        yield UserProgress(
+                            user_id=user_id, module_id=module_id, completed=done,
+                            completed_at=when if done else None,
+                            created_at=started, updated_at=when if done else started,
+                        )
+                        if done and rng.random() < 0.6:
+                            for question_id in question_ids:
+                                body, compressed = encode_answer(self.sentence(rng, 5, 30) + '.')
+                                yield ReflectionAnswer(
+                                    user_id=user_id, question_id=question_id, body=body,
+                                    compressed=compressed, created_at=when, updated_at=when,
+                                )
+                        if not done:
+                            break
+                        finished += 1
+                        # Gap before the next module: usually same week, sometimes much longer.
+                        when += timedelta(hours=rng.expovariate(1 / 30))
+                    if finished:
+                        completion = CourseCompletion(
+                            user_id=user_id, course_id=course_id, module_count=len(modules),
+                            layout_at=updated_at, updated_at=min(when, self.end),
+                        )
+                        completion.set_bits((1 << finished) - 1)
+                        yield completion
+
+        self.bulk_create(progress_rows())
+        self.log(f"{self.stats.get(UserProgress._meta.label, 0)} progress rows")
+
+    def finish(self, layout):
+        """Fill the tables that signals maintain for single-row writes."""
+        courses = Course.objects.filter(slug__startswith=f'{self.prefix}-')
+        courses.refresh_published_module_counts()
+        course_ids = list(courses.values_list('pk', flat=True))
+        record_changes(
+            [(Course, pk, 'insert') for pk in course_ids]
+            + [(model, pk, 'insert') for model, pk in descendants(course_ids)],
+            batch_size=self.batch_size,
+        )
+        self.log('change log')
+        with transaction.atomic():
+            rebuild_funnels(batch_size=self.batch_size)
+        self.log('funnels')
+        if self.search:
+            module_ids = list(Module.objects.filter(
+                course__slug__startswith=f'{self.prefix}-'
+            ).order_by('id').values_list('id', flat=True))
+            for start in range(0, len(module_ids), 200):
+                with transaction.atomic():
+                    reindex_modules(module_ids[start:start + 200])
+            self.log('search documents')
+        bump_content_version()
+
+
+def accumulate_zipf(count, exponent):
+    """Cumulative Zipf weights for ``random.choices(cum_weights=...)``."""
+    total = 0.0
+    for rank in range(1, count + 1):
+        total += 1 / rank ** exponent
+        yield total
@@ -0,0 +1,34 @@
+"""Tests for the course API."""
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient, APITestCase
+
+from .models import Course, Module, ReflectionQuestion
+
+
+class ProgressFieldsetTests(APITestCase):
+    """``?fields=`` on the progress list, with and without ``?include=``."""
+
+    def setUp(self):
+        course = Course.objects.create(slug='course', title='Course', description='', icon='Book')
+        module = Module.objects.create(course=course, slug='module', title='Module', objective='')
+        ReflectionQuestion.objects.create(module=module, question='Why?', order=0)
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('learner', password='Str0ng-pass-1!'))
+        response = self.client.post('/api/progress/complete_module/', {
+            'course_slug': 'course', 'module_slug': 'module', 'reflection_answers': {'0': 'Because.'},
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_fields_with_included_answers(self):
+        response = self.client.get(
+            '/api/progress/', {'include': 'reflection_answers', 'fields': 'module_slug,reflection_answers'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [
+            {'module_slug': 'module', 'reflection_answers': {'0': 'Because.'}},
+        ])
+
+    def test_answers_are_unknown_without_include(self):
+        response = self.client.get('/api/progress/', {'fields': 'module_slug,reflection_answers'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('reflection_answers', response.json()['fields'][0])
@@ -1,13 +1,21 @@
 """URL configuration for courses API."""
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CourseViewSet, ModuleViewSet, UserProgressViewSet
+from .views import (
+    CourseViewSet, ModuleViewSet, UserProgressViewSet, progress_export, module_funnel,
+    search, course_packs, content_changes
+)
 
 router = DefaultRouter()
 router.register(r'courses', CourseViewSet, basename='course')
 router.register(r'progress', UserProgressViewSet, basename='progress')
 
 urlpatterns = [
+    path('progress/export/', progress_export, name='progress-export'),
+    path('analytics/funnel/', module_funnel, name='analytics-funnel'),
+    path('search/', search, name='search'),
+    path('packs/', course_packs, name='course-packs'),
+    path('content/changes/', content_changes, name='content-changes'),
     path('', include(router.urls)),
     path('courses/<slug:course_slug>/modules/', 
          ModuleViewSet.as_view({'get': 'list'}), 
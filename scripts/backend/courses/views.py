@@ -1,22 +1,244 @@
 """Views for course API."""
+import base64
+import hashlib
+from datetime import timedelta
+
 from rest_framework import viewsets, status
-from rest_framework.decorators import action
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny, SAFE_METHODS
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Prefetch, prefetch_related_objects
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils import timezone
-from .models import Course, Module, UserProgress
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from bfpa_backend.fieldsets import fieldset_key, sparse_queryset
+from .analytics import FunnelChanges, progress_state, record_funnel_events
+from .answers import UnknownQuestion, answer_rows, load_answers, module_questions, save_answers
+from .cache import content_cache, get_content_version
+from .changes import CHANGES_PAGE_SIZE, changes_since
+from .export import (
+    EXPORT_FORMATS, RENDERERS, iter_progress_rows, parse_boundary, progress_export_queryset
+)
+from .models import Course, CoursePack, Module, UserProgress, CourseCompletion, ModuleDailyFunnel
+from .packs import PACK_FORMAT, PackNotBuilt, is_built, iter_file_range, pack_path, parse_range
+from .queries import module_content_prefetches, published_modules
+from .progress import (
+    apply_sync_operations, rebuild_course_completion, record_module_completion
+)
+from .search import get_search_backend
 from .serializers import (
     CourseListSerializer, CourseDetailSerializer,
     ModuleListSerializer, ModuleDetailSerializer,
-    UserProgressSerializer
+    UserProgressSerializer, UserProgressWithAnswersSerializer, ProgressSyncSerializer,
+    CourseCompletionSerializer
 )
 
 
-class CourseViewSet(viewsets.ReadOnlyModelViewSet):
+def module_completed(user):
+    """``Exists`` expression: has ``user`` completed the outer module?
+
+    UserProgress lives on the primary only, so querysets using this must
+    run there (``.using(DEFAULT_DB_ALIAS)``); the router only sees the
+    outer model.
+    """
+    return Exists(UserProgress.objects.filter(
+        user=user if user.is_authenticated else None,
+        module=OuterRef('pk'),
+        completed=True
+    ))
+
+
+def unlock_states(modules):
+    """Lock state of each ``(slug, order, completed)`` in course order.
+
+    A module is unlocked when it is the first published module or the
+    published module before it (by ``order``, then ``id``) is completed, so
+    gaps in ``order`` and unpublished modules do not break the chain. Each
+    entry has the module ``slug``, ``order`` and a ``state`` of
+    ``completed``, ``unlocked`` or ``locked``.
+    """
+    states = []
+    previous_completed = True
+    for slug, order, is_completed in modules:
+        if is_completed:
+            state = 'completed'
+        elif previous_completed:
+            state = 'unlocked'
+        else:
+            state = 'locked'
+        states.append({'slug': slug, 'order': order, 'state': state})
+        previous_completed = is_completed
+    return states
+
+
+def module_unlock_states(course_slug, user):
+    """Return the lock state of every published module of a course for ``user``.
+
+    Runs a single query; see ``unlock_states``.
+    """
+    modules = published_modules().using(DEFAULT_DB_ALIAS).filter(
+        course__slug=course_slug,
+        course__is_published=True
+    ).annotate(completed=module_completed(user)).values_list('slug', 'order', 'completed')
+    return unlock_states(modules)
+
+
+class RenderedContentMixin:
+    """Serve detail responses from the pre-rendered content cache.
+
+    JSON renderings are cached per content version, so a hit skips the
+    object lookup, the serializer and the renderer. Other formats (the
+    browsable API) are rendered normally.
+    """
+
+    def get_content_cache_key(self):
+        """Return a tuple identifying the requested resource."""
+        raise NotImplementedError
+
+    def retrieve(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        if renderer.format != 'json':
+            return super().retrieve(request, *args, **kwargs)
+
+        media_type = request.accepted_media_type
+        cache_key = (
+            (get_content_version(), media_type) + self.get_content_cache_key() + fieldset_key(request)
+        )
+        body = content_cache.get(cache_key)
+        if body is None:
+            data = self.get_serializer(self.get_object()).data
+            body = renderer.render(data, media_type, self.get_renderer_context())
+            content_cache.set(cache_key, body)
+        return HttpResponse(body, content_type=media_type)
+
+
+def serve_pack(request, course, pack):
+    """Serve a course pack from disk, honouring conditional and Range requests.
+
+    A single ``Range`` gets a 206 with just those bytes so interrupted
+    downloads can resume; ``If-Range`` falls back to the whole file when
+    the pack changed in between.
+    """
+    etag = quote_etag(pack.sha256)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        byte_range = None
+        if_range = request.headers.get('If-Range')
+        if if_range is None or if_range.strip() == etag:
+            try:
+                byte_range = parse_range(request.headers.get('Range'), pack.size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{pack.size}'
+        if response is None and byte_range is not None:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                iter_file_range(pack_path(pack), start, end), status=206, content_type='application/gzip'
+            )
+            response['Content-Range'] = f'bytes {start}-{end}/{pack.size}'
+            response['Content-Length'] = end - start + 1
+        elif response is None:
+            response = FileResponse(open(pack_path(pack), 'rb'), content_type='application/gzip')
+
+    response['ETag'] = etag
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = f'attachment; filename="{course.slug}.json.gz"'
+    response['Repr-Digest'] = f'sha-256=:{base64.b64encode(bytes.fromhex(pack.sha256)).decode()}:'
+    patch_cache_control(response, public=True, **settings.CONTENT_CACHE_CONTROL)
+    return response
+
+
+class ConditionalContentMixin:
+    """Answer conditional GETs for content before any serialization.
+
+    Content signals touch ``updated_at`` on the owning module and course,
+    so a resource's validators come from a single small query. The ETag
+    also covers row counts so deletions change it.
+    """
+
+    def get_content_state(self):
+        """Return ``(last_modified, fingerprint)`` for the requested resource."""
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+
+    def conditional_response(self, request, respond, *args, **kwargs):
+        last_modified, fingerprint = self.get_content_state()
+        digest = hashlib.sha1(
+            '|'.join((request.accepted_media_type, *fieldset_key(request), fingerprint)).encode()
+        ).hexdigest()
+        etag = quote_etag(digest)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = respond(request, *args, **kwargs)
+
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        patch_cache_control(response, public=True, **settings.CONTENT_CACHE_CONTROL)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+
+class SparseFieldsViewMixin:
+    """Load only the columns a ``?fields=``/``?omit=`` request renders.
+
+    Applies to reads that go through ``filter_queryset``; the pagination
+    key is always loaded.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return sparse_queryset(queryset, self.get_serializer(), keep=self.keyset_ordering)
+
+
+class CourseViewSet(SparseFieldsViewMixin, ConditionalContentMixin, RenderedContentMixin,
+                    viewsets.ReadOnlyModelViewSet):
     """ViewSet for courses."""
     queryset = Course.objects.filter(is_published=True)
     permission_classes = [AllowAny]
+    keyset_ordering = ('order', 'id')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            if settings.USE_DENORMALIZED_MODULE_COUNT:
+                queryset = queryset.annotate(module_count=F('published_module_count'))
+            else:
+                queryset = queryset.with_module_count()
+        elif self.action == 'retrieve':
+            queryset = queryset.prefetch_related(
+                Prefetch('modules', queryset=published_modules())
+            )
+        return queryset
+
+    def get_content_cache_key(self):
+        return ('course', self.kwargs.get('pk'))
+
+    def get_content_state(self):
+        queryset = Course.objects.filter(is_published=True)
+        if self.action == 'retrieve':
+            course = get_object_or_404(
+                queryset.values('id', 'updated_at'), slug=self.kwargs.get('pk')
+            )
+            return course['updated_at'], f"course:{course['id']}:{course['updated_at'].isoformat()}"
+        state = queryset.aggregate(last_modified=Max('updated_at'), count=Count('id'))
+        last_modified = state['last_modified']
+        return last_modified, f"courses:{state['count']}:{last_modified and last_modified.isoformat()}"
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -25,21 +247,102 @@ class CourseViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_object(self):
         """Allow lookup by slug."""
-        queryset = self.get_queryset()
+        queryset = self.filter_queryset(self.get_queryset())
         slug = self.kwargs.get('pk')
         return get_object_or_404(queryset, slug=slug)
 
+    @action(detail=True, methods=['get'])
+    def bundle(self, request, pk=None):
+        """Get everything the course and module pages render in one response.
+
+        Returns the course outline, the full content of the ``module`` given
+        in the query string (or ``null``), the user's progress in the course
+        and the unlock map. Uses the same number of queries whatever the
+        size of the course: the course, its modules with completion flags,
+        four for the module content and one for progress.
+        """
+        course = get_object_or_404(
+            self.get_queryset().prefetch_related(Prefetch(
+                'modules',
+                queryset=published_modules().using(DEFAULT_DB_ALIAS).annotate(
+                    completed=module_completed(request.user)
+                )
+            )),
+            slug=pk
+        )
+        modules = list(course.modules.all())
+
+        module = None
+        module_slug = request.query_params.get('module')
+        if module_slug:
+            module = next((m for m in modules if m.slug == module_slug), None)
+            if module is None:
+                raise Http404
+            prefetch_related_objects([module], *module_content_prefetches())
+
+        progress = UserProgress.objects.none()
+        if request.user.is_authenticated:
+            progress = UserProgress.objects.filter(
+                user=request.user, module__course=course
+            ).select_related('module__course')
+
+        return Response({
+            'course': CourseDetailSerializer(course).data,
+            'module': ModuleDetailSerializer(module).data if module else None,
+            'progress': UserProgressSerializer(progress, many=True).data,
+            'unlock_map': {
+                'course': course.slug,
+                'modules': unlock_states((m.slug, m.order, m.completed) for m in modules),
+            },
+        })
+
+    @action(detail=True, methods=['get'])
+    def pack(self, request, pk=None):
+        """Download the course as one compressed offline pack.
+
+        Serves the last pack ``build_course_packs`` built, or a 503 with
+        ``Retry-After`` before the first build. Supports ``Range`` and
+        ``If-Range`` for resuming.
+        """
+        course = get_object_or_404(Course, slug=pk, is_published=True)
+        pack = CoursePack.objects.filter(course=course).first()
+        if not is_built(pack):
+            raise PackNotBuilt
+        return serve_pack(request, course, pack)
 
-class ModuleViewSet(viewsets.ReadOnlyModelViewSet):
+
+class ModuleViewSet(SparseFieldsViewMixin, ConditionalContentMixin, RenderedContentMixin,
+                    viewsets.ReadOnlyModelViewSet):
     """ViewSet for modules."""
     permission_classes = [AllowAny]
+    keyset_ordering = ('order', 'id')
 
     def get_queryset(self):
         course_slug = self.kwargs.get('course_slug')
-        return Module.objects.filter(
+        queryset = published_modules().filter(
             course__slug=course_slug,
-            is_published=True
+            course__is_published=True
         )
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(*module_content_prefetches())
+        return queryset
+
+    def get_content_cache_key(self):
+        return ('module', self.kwargs.get('course_slug'), self.kwargs.get('pk'))
+
+    def get_content_state(self):
+        queryset = published_modules().filter(
+            course__slug=self.kwargs.get('course_slug'),
+            course__is_published=True
+        )
+        if self.action == 'retrieve':
+            module = get_object_or_404(
+                queryset.values('id', 'updated_at'), slug=self.kwargs.get('pk')
+            )
+            return module['updated_at'], f"module:{module['id']}:{module['updated_at'].isoformat()}"
+        state = queryset.aggregate(last_modified=Max('updated_at'), count=Count('id'))
+        last_modified = state['last_modified']
+        return last_modified, f"modules:{state['count']}:{last_modified and last_modified.isoformat()}"
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -48,18 +351,52 @@ class ModuleViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_object(self):
         """Allow lookup by slug."""
-        queryset = self.get_queryset()
+        queryset = self.filter_queryset(self.get_queryset())
         slug = self.kwargs.get('pk')
         return get_object_or_404(queryset, slug=slug)
 
 
-class UserProgressViewSet(viewsets.ModelViewSet):
+class UserProgressViewSet(SparseFieldsViewMixin, viewsets.ModelViewSet):
     """ViewSet for user progress tracking."""
     serializer_class = UserProgressSerializer
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ('updated_at', 'id')
 
     def get_queryset(self):
-        return UserProgress.objects.filter(user=self.request.user)
+        queryset = UserProgress.objects.filter(user=self.request.user).select_related('module__course')
+        updated_since = self.request.query_params.get('updated_since')
+        if updated_since and self.action in ('list', 'course_progress'):
+            moment = parse_boundary(updated_since)
+            if moment is None:
+                raise ValidationError({'updated_since': 'Must be an ISO date or datetime.'})
+            queryset = queryset.filter(updated_at__gt=moment)
+        return queryset
+
+    def includes_answers(self):
+        return 'reflection_answers' in self.request.query_params.get('include', '').split(',')
+
+    def get_serializer_class(self):
+        """Add reflection answers when the request asks for ``?include=reflection_answers``.
+
+        They are left out by default since the progress tracker only needs
+        completion state.
+        """
+        if self.includes_answers():
+            return UserProgressWithAnswersSerializer
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        """Load the answers of every row being serialized in one query."""
+        if not self.includes_answers() or not args:
+            return super().get_serializer(*args, **kwargs)
+        rows = list(args[0]) if kwargs.get('many') else [args[0]]
+        kwargs['context'] = {
+            **self.get_serializer_context(),
+            'reflection_answers': load_answers(
+                {row.user_id for row in rows}, {row.module_id for row in rows}
+            ),
+        }
+        return super().get_serializer(rows if kwargs.get('many') else rows[0], *args[1:], **kwargs)
 
     @action(detail=False, methods=['get'])
     def course_progress(self, request):
@@ -68,63 +405,273 @@ class UserProgressViewSet(viewsets.ModelViewSet):
         if not course_slug:
             return Response({'error': 'course parameter required'}, status=400)
         
-        progress = self.get_queryset().filter(module__course__slug=course_slug)
-        serializer = self.get_serializer(progress, many=True)
-        return Response(serializer.data)
+        progress = self.filter_queryset(self.get_queryset()).filter(module__course__slug=course_slug)
+        page = self.paginate_queryset(progress)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['post'])
     def complete_module(self, request):
         """Mark a module as complete."""
         course_slug = request.data.get('course_slug')
         module_slug = request.data.get('module_slug')
-        reflection_answers = request.data.get('reflection_answers', {})
+        reflection_answers = request.data.get('reflection_answers') or {}
+        if not isinstance(reflection_answers, dict):
+            return Response({'error': 'reflection_answers must be an object'}, status=400)
 
         module = get_object_or_404(
             Module, 
             course__slug=course_slug, 
             slug=module_slug
         )
+        try:
+            answers = answer_rows(
+                request.user, module_questions([module.pk]).get(module.pk, []), reflection_answers
+            )
+        except UnknownQuestion as exc:
+            return Response({'error': str(exc)}, status=400)
 
-        progress, created = UserProgress.objects.get_or_create(
-            user=request.user,
-            module=module
-        )
-        progress.completed = True
-        progress.completed_at = timezone.now()
-        progress.reflection_answers = reflection_answers
-        progress.save()
+        with transaction.atomic():
+            progress, created = UserProgress.objects.get_or_create(
+                user=request.user,
+                module=module
+            )
+            before = None if created else progress_state(progress)
+            progress.completed = True
+            progress.completed_at = timezone.now()
+            progress.save()
+            save_answers(answers)
+            record_module_completion(request.user, module)
+            funnel = FunnelChanges()
+            funnel.change(module.pk, before, progress_state(progress))
+            record_funnel_events(funnel)
 
         serializer = self.get_serializer(progress)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['post'])
+    def sync(self, request):
+        """Apply a batch of offline progress operations.
+
+        Each operation carries a client-generated ``id``; IDs that were
+        already applied are skipped. Returns the outcome of every operation
+        and the merged progress for each course the batch referenced.
+        """
+        serializer = ProgressSyncSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = apply_sync_operations(request.user, serializer.validated_data['operations'])
+
+        progress = {slug: [] for slug in sorted(result.pop('course_slugs'))}
+        rows = self.get_queryset().filter(module__course__slug__in=progress)
+        for item in self.get_serializer(rows, many=True).data:
+            progress[item['course_slug']].append(item)
+        result['progress'] = progress
+        return Response(result)
+
     @action(detail=False, methods=['get'])
-    def is_module_unlocked(self, request):
-        """Check if a module is unlocked for the user."""
+    def reflection_answers(self, request):
+        """Get the user's reflection answers for one module, keyed by question position."""
         course_slug = request.query_params.get('course')
         module_slug = request.query_params.get('module')
-
         if not course_slug or not module_slug:
             return Response({'error': 'course and module parameters required'}, status=400)
 
         module = get_object_or_404(Module, course__slug=course_slug, slug=module_slug)
-        
-        # First module is always unlocked
-        if module.order == 0:
-            return Response({'unlocked': True})
+        answers = load_answers([request.user.pk], [module.pk])
+        return Response({
+            'course': course_slug,
+            'module': module_slug,
+            'answers': answers.get((request.user.pk, module.pk), {}),
+        })
+
+    @action(detail=False, methods=['get'])
+    def completion(self, request):
+        """Get the user's completion summary for a course from its bitmap.
+
+        Positions index the course's published modules in the order the
+        course detail endpoint lists them.
+        """
+        course_slug = request.query_params.get('course')
+        if not course_slug:
+            return Response({'error': 'course parameter required'}, status=400)
 
-        # Check if previous module is completed
-        previous_module = Module.objects.filter(
+        completion = CourseCompletion.objects.select_related('course').filter(
+            user=request.user,
             course__slug=course_slug,
-            order=module.order - 1
+            course__is_published=True
         ).first()
+        if completion is None or completion.is_stale:
+            course = get_object_or_404(Course, slug=course_slug, is_published=True)
+            completion = rebuild_course_completion(request.user, course)
+        return Response(CourseCompletionSerializer(completion, context={'request': request}).data)
 
-        if not previous_module:
-            return Response({'unlocked': True})
+    @action(detail=False, methods=['get'])
+    def unlock_map(self, request):
+        """Get the lock state of every module in a course."""
+        course_slug = request.query_params.get('course')
+        if not course_slug:
+            return Response({'error': 'course parameter required'}, status=400)
 
-        completed = UserProgress.objects.filter(
-            user=request.user,
-            module=previous_module,
-            completed=True
-        ).exists()
+        return Response({
+            'course': course_slug,
+            'modules': module_unlock_states(course_slug, request.user),
+        })
+
+    @action(detail=False, methods=['get'])
+    def is_module_unlocked(self, request):
+        """Check if a module is unlocked for the user."""
+        course_slug = request.query_params.get('course')
+        module_slug = request.query_params.get('module')
+
+        if not course_slug or not module_slug:
+            return Response({'error': 'course and module parameters required'}, status=400)
+
+        for module in module_unlock_states(course_slug, request.user):
+            if module['slug'] == module_slug:
+                return Response({'unlocked': module['state'] != 'locked'})
+        raise Http404
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def progress_export(request):
+    """Stream all user progress as NDJSON or CSV.
+
+    Accepts ``output`` (``ndjson`` or ``csv``), ``course``,
+    ``completed_after``, ``completed_before`` and ``organization`` filters.
+    """
+    output = request.query_params.get('output', 'ndjson')
+    if output not in EXPORT_FORMATS:
+        return Response({'error': f"output must be one of {', '.join(EXPORT_FORMATS)}"}, status=400)
+
+    filters = {
+        'course': request.query_params.get('course'),
+        'organization': request.query_params.get('organization'),
+    }
+    for name in ('completed_after', 'completed_before'):
+        value = request.query_params.get(name)
+        if value:
+            filters[name] = parse_boundary(value, end=name == 'completed_before')
+            if filters[name] is None:
+                return Response({'error': f'{name} must be an ISO date or datetime'}, status=400)
+
+    render, content_type = RENDERERS[output]
+    rows = iter_progress_rows(progress_export_queryset(**filters))
+    response = StreamingHttpResponse(render(rows), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="progress.{output}"'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def module_funnel(request):
+    """Get started/completed/drop-off counts for each module of a course.
+
+    Reads the rollup tables only, so the cost does not depend on the
+    number of progress rows. Pass ``days`` for a per-day series.
+    """
+    course_slug = request.query_params.get('course')
+    if not course_slug:
+        return Response({'error': 'course parameter required'}, status=400)
+    try:
+        days = int(request.query_params.get('days', 0))
+    except ValueError:
+        return Response({'error': 'days must be an integer'}, status=400)
+
+    course = get_object_or_404(Course, slug=course_slug)
+    # The funnel join reads a primary-only table, so pin the whole query there.
+    modules = list(
+        Module.objects.using(DEFAULT_DB_ALIAS).filter(course=course).order_by('order', 'id')
+        .values('id', 'slug', 'title', 'is_published', 'funnel__started', 'funnel__completed')
+    )
+    daily = {}
+    if days > 0:
+        since = timezone.localdate() - timedelta(days=days - 1)
+        rows = ModuleDailyFunnel.objects.filter(module__course=course, date__gte=since)
+        for row in rows.values('module_id', 'date', 'started', 'completed'):
+            daily.setdefault(row['module_id'], []).append({
+                'date': row['date'], 'started': row['started'], 'completed': row['completed'],
+            })
+
+    funnel = []
+    previous_completed = None
+    for module in modules:
+        started = module['funnel__started'] or 0
+        completed = module['funnel__completed'] or 0
+        entry = {
+            'slug': module['slug'],
+            'title': module['title'],
+            'is_published': module['is_published'],
+            'started': started,
+            'completed': completed,
+            'in_progress': started - completed,
+            'dropped_before': max(previous_completed - started, 0) if previous_completed is not None else 0,
+        }
+        if days > 0:
+            entry['daily'] = daily.get(module['id'], [])
+        funnel.append(entry)
+        if module['is_published']:
+            previous_completed = completed
+    return Response({'course': course.slug, 'modules': funnel})
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def course_packs(request):
+    """List the offline pack of every published course with its checksum.
+
+    Clients compare ``sha256`` with their stored copy to decide what to
+    download. Lists the last built packs; courses without one yet are left
+    out until ``build_course_packs`` runs.
+    """
+    packs = []
+    for course in Course.objects.filter(is_published=True).select_related('pack').order_by('order', 'id'):
+        pack = getattr(course, 'pack', None)
+        if not is_built(pack):
+            continue
+        packs.append({
+            'course': course.slug,
+            'title': course.title,
+            'content_updated_at': pack.content_updated_at,
+            'size': pack.size,
+            'sha256': pack.sha256,
+            'url': request.build_absolute_uri(reverse('course-pack', args=[course.slug])),
+        })
+    return Response({'format': PACK_FORMAT, 'packs': packs})
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def content_changes(request):
+    """Content rows added, changed or removed since a sync cursor.
+
+    Clients first call without ``since`` (or after ``reset``), fetch the
+    content in full, then keep passing back the returned ``cursor``.
+    """
+    try:
+        since = request.query_params.get('since')
+        since = int(since) if since else None
+        limit = int(request.query_params.get('limit', CHANGES_PAGE_SIZE))
+    except ValueError:
+        return Response({'error': 'since and limit must be integers'}, status=400)
+    return Response(changes_since(since, limit))
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def search(request):
+    """Search published course content.
+
+    Returns ranked hits with ``<mark>``-highlighted title and snippet and
+    the course and module slugs each hit belongs to.
+    """
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q parameter required'}, status=400)
+    try:
+        limit = min(int(request.query_params.get('limit', 20)), settings.SEARCH_MAX_RESULTS)
+    except ValueError:
+        return Response({'error': 'limit must be an integer'}, status=400)
 
-        return Response({'unlocked': completed})
+    results = get_search_backend().search(query, max(limit, 1))
+    return Response({'query': query, 'results': results})
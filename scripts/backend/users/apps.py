@@ -0,0 +1,9 @@
+"""App configuration for users."""
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    name = 'users'
+
+    def ready(self):
+        from . import signals  # noqa: F401
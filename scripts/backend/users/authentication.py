@@ -0,0 +1,46 @@
+"""Authentication backends for the API."""
+from django.contrib.auth.models import User
+from django.core import signing
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+from .tokens import read_token, revocations
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """Authenticate ``Authorization: Token <key>`` headers carrying signed tokens.
+
+    Keys without a signature separator are legacy DRF tokens and are left
+    to ``TokenAuthentication``. The returned user is a deferred instance
+    holding only its primary key, so no query runs unless a view reads
+    other user fields. Tokens of deleted or deactivated users and tokens
+    issued before a password change are revoked (see users.signals).
+    """
+    keyword = 'Token'
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if len(auth) != 2 or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            return None
+        if ':' not in key:
+            return None
+
+        try:
+            token = read_token(key)
+        except signing.BadSignature:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+        if token.expired:
+            raise exceptions.AuthenticationFailed('Token has expired.')
+        if revocations.is_revoked(token):
+            raise exceptions.AuthenticationFailed('Token has been revoked.')
+
+        user = User.from_db(DEFAULT_DB_ALIAS, ['id'], [token.user_id])
+        return (user, token)
+
+    def authenticate_header(self, request):
+        return self.keyword
@@ -0,0 +1,174 @@
+"""Bulk import of learner cohorts from partner rosters.
+
+Rosters are CSV (with a header row), JSON Lines or a JSON array of
+objects with the CohortMemberSerializer fields. CSV and JSON Lines are
+read as a stream, a batch at a time. Each batch is validated, its
+passwords are hashed across a process pool, and its users and profiles
+are inserted with ``bulk_create`` in one transaction. Bad rows are
+reported by row number (data rows count from 1) and skipped; the rest of
+the batch is still imported.
+
+Users get no stored token: API tokens are signed and issued at login.
+"""
+import codecs
+import csv
+import json
+import os
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .hashing import hashing_processes
+from .models import UserProfile
+from .serializers import CohortMemberSerializer
+
+ROSTER_FORMATS = ('csv', 'jsonl', 'json')
+ROSTER_CONTENT_TYPES = {
+    'text/csv': 'csv',
+    'application/x-ndjson': 'jsonl',
+    'application/jsonl': 'jsonl',
+    'application/json': 'json',
+}
+USER_FIELDS = ('username', 'email', 'first_name', 'last_name')
+PROFILE_FIELDS = ('role', 'organization', 'country', 'phone')
+
+
+def roster_format(name):
+    """Return the roster format for a file name or content type, or None."""
+    name = name.split(';')[0].strip().lower()
+    if name in ROSTER_CONTENT_TYPES:
+        return ROSTER_CONTENT_TYPES[name]
+    extension = name.rsplit('.', 1)[-1]
+    if extension == 'ndjson':
+        return 'jsonl'
+    return extension if extension in ROSTER_FORMATS else None
+
+
+def read_roster(stream, fmt):
+    """Yield the rows of a binary roster stream.
+
+    Rows are dicts without empty values; a JSON Lines row that does not
+    parse is yielded as None so it can be reported with its number.
+    """
+    if fmt == 'csv':
+        rows = csv.DictReader(codecs.iterdecode(stream, 'utf-8-sig'))
+    elif fmt == 'jsonl':
+        rows = (parse_json_line(line) for line in stream if line.strip())
+    elif fmt == 'json':
+        rows = json.load(stream)
+        if not isinstance(rows, list):
+            raise ValueError('A JSON roster must be an array of objects.')
+    else:
+        raise ValueError(f'Unknown roster format {fmt!r}.')
+    for row in rows:
+        if not isinstance(row, dict):
+            yield None
+            continue
+        yield {
+            str(key).strip().lower(): value.strip() if isinstance(value, str) else value
+            for key, value in row.items()
+            if key is not None and value not in ('', None)
+        }
+
+
+def parse_json_line(line):
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def import_cohort(rows, role='student', organization='', batch_size=None, workers=None, log=None):
+    """Create a user and profile for every valid row.
+
+    ``role`` and ``organization`` apply to rows that leave them out.
+    Returns ``{'created', 'failed', 'errors'}``, where each error is
+    ``{'row', 'username', 'errors'}`` with serializer-style messages, plus
+    ``error`` when the roster stopped being readable part way through.
+    """
+    batch_size = batch_size or settings.COHORT_IMPORT_BATCH_SIZE
+    report = {'created': 0, 'failed': 0, 'errors': []}
+    seen = set()
+    numbered = enumerate(rows, start=1)
+    with hashing_processes(workers) as pool:
+        while True:
+            try:
+                batch = list(islice(numbered, batch_size))
+            except ValueError as exc:
+                # Unreadable input ends the import; earlier batches stay imported.
+                report['error'] = f'Could not read roster: {exc}'
+                break
+            if not batch:
+                break
+            import_batch(batch, pool, seen, report, defaults={'role': role, 'organization': organization})
+            if log:
+                log(f"row {batch[-1][0]}: {report['created']} created, {report['failed']} failed")
+    report['errors'].sort(key=lambda error: error['row'])
+    return report
+
+
+def import_batch(batch, pool, seen, report, defaults):
+    """Validate, hash and insert one batch of ``(row number, row)`` pairs."""
+    def fail(number, username, errors):
+        report['failed'] += 1
+        report['errors'].append({'row': number, 'username': username, 'errors': errors})
+
+    members = []
+    for number, row in batch:
+        if row is None:
+            fail(number, None, {'non_field_errors': ['Row is not a JSON object.']})
+            continue
+        serializer = CohortMemberSerializer(data=row)
+        if not serializer.is_valid():
+            fail(number, row.get('username'), serializer.errors)
+            continue
+        member = {**defaults, **serializer.validated_data}
+        if member['username'] in seen:
+            fail(number, member['username'], {'username': ['Duplicate username in roster.']})
+            continue
+        seen.add(member['username'])
+        members.append((number, member))
+
+    existing = set(User.objects.filter(
+        username__in=[member['username'] for _, member in members]
+    ).values_list('username', flat=True))
+    for number, member in members:
+        if member['username'] in existing:
+            fail(number, member['username'], {'username': ['A user with that username already exists.']})
+    members = [(number, member) for number, member in members if member['username'] not in existing]
+    if not members:
+        return
+
+    passwords = [member['password'] for _, member in members if member['password']]
+    chunksize = max(1, len(passwords) // (4 * (os.cpu_count() or 1)))
+    hashes = pool.map(make_password, passwords, chunksize=chunksize)
+    users = [
+        User(password=next(hashes) if member['password'] else make_password(None),
+             **{field: member[field] for field in USER_FIELDS})
+        for _, member in members
+    ]
+
+    with transaction.atomic():
+        # A username registered since the check above is skipped rather than
+        # failing the batch; hashes are salted, so they tell our rows apart.
+        User.objects.bulk_create(users, ignore_conflicts=True)
+        ours = {user.password for user in users}
+        inserted = {
+            username: pk
+            for username, pk, password in User.objects.filter(
+                username__in=[user.username for user in users]
+            ).values_list('username', 'pk', 'password')
+            if password in ours
+        }
+        UserProfile.objects.bulk_create([
+            UserProfile(user_id=inserted[member['username']], **{field: member[field] for field in PROFILE_FIELDS})
+            for _, member in members
+            if member['username'] in inserted
+        ])
+    for number, member in members:
+        if member['username'] not in inserted:
+            fail(number, member['username'], {'username': ['A user with that username already exists.']})
+    report['created'] += len(inserted)
@@ -0,0 +1,124 @@
+"""Bounded worker pool for password hashing.
+
+PBKDF2 runs in C and releases the GIL, so hashing on a small thread pool
+uses spare cores. The request worker still waits for its hash, so the
+pool's job is to bound how many request workers auth can tie up at once:
+admission is capped at ``PASSWORD_HASHING_WORKERS +
+PASSWORD_HASHING_MAX_QUEUE`` jobs, and past that auth requests fail fast
+with a 503. The pool is per process: keep that sum below the number of
+request threads each server process runs, so content reads always have
+threads left during login bursts.
+
+Bulk imports hash thousands of passwords at once and use
+``hashing_processes`` instead, a process pool spanning every core.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingPoolBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many sign-ins in progress, please retry shortly.'
+    default_code = 'hashing_busy'
+    wait = 1
+
+
+class HashingPool:
+    """Thread pool with bounded admission and queue-depth counters."""
+
+    def __init__(self, workers, max_queue):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hashing')
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+    def run(self, fn, *args, **kwargs):
+        """Run ``fn`` on the pool and return its result, or raise HashingPoolBusy."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HashingPoolBusy()
+        with self._lock:
+            self.admitted += 1
+        # Carry the caller's execute wrappers (query counters, Server-Timing)
+        # over to the pool thread so its queries count towards the request.
+        wrappers = {alias: list(connections[alias].execute_wrappers) for alias in connections}
+        try:
+            return self._executor.submit(self._call, time.monotonic(), wrappers, fn, args, kwargs).result()
+        finally:
+            with self._lock:
+                self.admitted -= 1
+            self._slots.release()
+
+    def _call(self, submitted_at, wrappers, fn, args, kwargs):
+        with self._lock:
+            self.running += 1
+            self.wait_seconds += time.monotonic() - submitted_at
+        close_old_connections()
+        try:
+            with ExitStack() as stack:
+                for alias, alias_wrappers in wrappers.items():
+                    for wrapper in alias_wrappers:
+                        stack.enter_context(connections[alias].execute_wrapper(wrapper))
+                return fn(*args, **kwargs)
+        finally:
+            close_old_connections()
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'running': self.running,
+                'queued': self.admitted - self.running,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'avg_wait_ms': round(self.wait_seconds * 1000 / self.completed, 2) if self.completed else 0,
+            }
+
+
+hashing_pool = HashingPool(
+    settings.PASSWORD_HASHING_WORKERS,
+    settings.PASSWORD_HASHING_MAX_QUEUE,
+)
+
+
+def setup_hashing_process():
+    """Load Django in a spawned worker so hashers follow the project settings."""
+    import django
+    django.setup()
+
+
+@contextmanager
+def hashing_processes(workers=None):
+    """Yield a process pool for hashing many passwords, e.g. ``pool.map(make_password, ...)``.
+
+    Workers are spawned rather than forked, so the pool is safe to start
+    from a threaded server, and default to one per core
+    (``PASSWORD_IMPORT_WORKERS``).
+    """
+    workers = workers or settings.PASSWORD_IMPORT_WORKERS or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=setup_hashing_process,
+    ) as pool:
+        yield pool
@@ -0,0 +1,58 @@
+"""Import a cohort of learners from a CSV or JSON roster."""
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.cohorts import ROSTER_FORMATS, import_cohort, read_roster, roster_format
+from users.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = (
+        'Create users and profiles from a roster (CSV with a header row, JSON Lines or a JSON array). '
+        'Passwords are hashed on every core; invalid rows are reported and skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('roster', help="Roster file path, or '-' for stdin.")
+        parser.add_argument('--format', choices=ROSTER_FORMATS, help='Defaults to the file extension.')
+        parser.add_argument(
+            '--role', choices=[choice for choice, _ in UserProfile.ROLE_CHOICES], default='student',
+            help='Role for rows without one.'
+        )
+        parser.add_argument('--organization', default='', help='Organization for rows without one.')
+        parser.add_argument('--batch-size', type=int, help='Rows per transaction (default COHORT_IMPORT_BATCH_SIZE).')
+        parser.add_argument('--workers', type=int, help='Hashing processes (default PASSWORD_IMPORT_WORKERS).')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or roster_format(options['roster'])
+        if fmt is None:
+            raise CommandError('Cannot tell the roster format from its name; pass --format')
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        began = time.monotonic()
+        stream = sys.stdin.buffer if options['roster'] == '-' else open(options['roster'], 'rb')
+        try:
+            report = import_cohort(
+                read_roster(stream, fmt), role=options['role'], organization=options['organization'],
+                batch_size=options['batch_size'], workers=options['workers'],
+                log=lambda message: self.stdout.write(f'[{time.monotonic() - began:7.1f}s] {message}'),
+            )
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        for error in report['errors']:
+            messages = '; '.join(
+                f'{field}: {" ".join(str(message) for message in messages)}'
+                for field, messages in error['errors'].items()
+            )
+            self.stderr.write(f"row {error['row']} ({error['username'] or '-'}): {messages}")
+        if 'error' in report:
+            raise CommandError(f"{report['error']} ({report['created']} users imported before it)")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} users, {report['failed']} rows failed, "
+            f'in {time.monotonic() - began:.1f}s.'
+        ))
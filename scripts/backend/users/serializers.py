@@ -1,17 +1,22 @@
 """Serializers for user API."""
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import ValidationError as DjangoValidationError
+from bfpa_backend.fieldsets import SparseFieldsMixin
+from .hashing import hashing_pool
 from .models import UserProfile
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = UserProfile
         fields = ['role', 'organization', 'country', 'phone', 'bio']
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     profile = UserProfileSerializer(read_only=True)
 
     class Meta:
@@ -39,8 +44,13 @@ class RegisterSerializer(serializers.ModelSerializer):
         role = validated_data.pop('role')
         organization = validated_data.pop('organization', '')
         validated_data.pop('password_confirm')
-        
-        user = User.objects.create_user(**validated_data)
+        password = validated_data.pop('password')
+
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
+        user.password = hashing_pool.run(make_password, password)
+        user.save()
         UserProfile.objects.create(user=user, role=role, organization=organization)
         return user
 
@@ -48,3 +58,31 @@ class RegisterSerializer(serializers.ModelSerializer):
 class LoginSerializer(serializers.Serializer):
     username = serializers.CharField()
     password = serializers.CharField(write_only=True)
+
+
+class CohortMemberSerializer(serializers.Serializer):
+    """One row of a cohort roster (see users.cohorts).
+
+    Username uniqueness is checked per batch by the importer. A missing
+    password leaves the account with an unusable one.
+    """
+    username = serializers.CharField(max_length=150, validators=[UnicodeUsernameValidator()])
+    email = serializers.EmailField(required=False, default='')
+    password = serializers.CharField(write_only=True, required=False, default='')
+    first_name = serializers.CharField(max_length=150, required=False, default='')
+    last_name = serializers.CharField(max_length=150, required=False, default='')
+    role = serializers.ChoiceField(choices=UserProfile.ROLE_CHOICES, required=False)
+    organization = serializers.CharField(max_length=255, required=False)
+    country = serializers.CharField(max_length=100, required=False, default='')
+    phone = serializers.CharField(max_length=20, required=False, default='')
+
+    def validate(self, attrs):
+        attrs['username'] = User.normalize_username(attrs['username'])
+        attrs['email'] = User.objects.normalize_email(attrs['email'])
+        if attrs['password']:
+            user = User(**{field: attrs[field] for field in ('username', 'email', 'first_name', 'last_name')})
+            try:
+                validate_password(attrs['password'], user)
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError({'password': list(exc.messages)})
+        return attrs
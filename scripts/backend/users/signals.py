@@ -0,0 +1,32 @@
+"""Signal handlers that revoke a user's signed tokens."""
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .tokens import revocations
+
+TOKEN_FIELDS = {'password', 'is_active'}
+
+
+def remember_token_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Note whether this save changes the password or deactivates the user."""
+    instance._revoke_tokens = False
+    if raw or instance.pk is None or (update_fields is not None and not TOKEN_FIELDS & set(update_fields)):
+        return
+    stored = User.objects.filter(pk=instance.pk).values_list('password', 'is_active').first()
+    if stored is not None:
+        password, is_active = stored
+        instance._revoke_tokens = password != instance.password or (is_active and not instance.is_active)
+
+
+def revoke_saved_user_tokens(sender, instance, raw=False, **kwargs):
+    if getattr(instance, '_revoke_tokens', False):
+        revocations.revoke_user(instance.pk)
+
+
+def revoke_deleted_user_tokens(sender, instance, **kwargs):
+    revocations.revoke_user(instance.pk)
+
+
+pre_save.connect(remember_token_state, sender=User, dispatch_uid='users_remember_token_state')
+post_save.connect(revoke_saved_user_tokens, sender=User, dispatch_uid='users_revoke_saved_tokens')
+post_delete.connect(revoke_deleted_user_tokens, sender=User, dispatch_uid='users_revoke_deleted_tokens')
@@ -0,0 +1,142 @@
+"""Stateless signed API tokens.
+
+A token is a signed payload carrying the user id, a random token id
+(``jti``), its issue time and an expiry time, so verifying one needs no
+database query. Revoked token ids are kept in a small table and mirrored
+in every process by :data:`revocations`, which re-syncs from the table at
+most once every ``SIGNED_TOKEN_REVOCATION_REFRESH`` seconds. The same
+table holds one ``user:<id>`` row per user whose tokens were all revoked
+(see users.signals: password changes, deactivation and deletion); tokens
+issued before that row's ``revoked_at`` are rejected.
+"""
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+from .models import RevokedToken
+
+TOKEN_SALT = 'users.tokens'
+
+
+@dataclass(frozen=True)
+class SignedToken:
+    key: str
+    user_id: int
+    jti: str
+    issued_at: datetime
+    expires_at: datetime
+
+    @property
+    def expired(self):
+        return self.expires_at <= timezone.now()
+
+
+def to_millis(value):
+    return int(value.timestamp() * 1000)
+
+
+def from_millis(value):
+    return datetime.fromtimestamp(value / 1000, tz=dt_timezone.utc)
+
+
+def issue_token(user):
+    """Return a new signed token key for ``user``."""
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=settings.SIGNED_TOKEN_MAX_AGE)
+    payload = {
+        'u': user.pk,
+        'j': secrets.token_urlsafe(9),
+        'i': to_millis(now),
+        'e': int(expires_at.timestamp()),
+    }
+    return signing.dumps(payload, salt=TOKEN_SALT, compress=True)
+
+
+def read_token(key):
+    """Verify ``key`` and return its :class:`SignedToken`.
+
+    Raises ``django.core.signing.BadSignature`` for tampered or malformed
+    keys. Expiry and revocation are left to the caller.
+    """
+    payload = signing.loads(key, salt=TOKEN_SALT)
+    try:
+        return SignedToken(
+            key=key,
+            user_id=int(payload['u']),
+            jti=str(payload['j']),
+            issued_at=from_millis(int(payload['i'])),
+            expires_at=datetime.fromtimestamp(payload['e'], tz=dt_timezone.utc),
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise signing.BadSignature('Malformed token payload.') from exc
+
+
+def user_jti(user_id):
+    # ``:`` never appears in a random jti, so these cannot collide.
+    return f'user:{user_id}'
+
+
+class RevocationList:
+    """In-process mirror of unexpired rows in :class:`RevokedToken`.
+
+    Maps each revoked jti to ``(revoked_at, expires_at)``.
+    """
+
+    def __init__(self):
+        self._revoked = {}
+        self._synced_at = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, token):
+        """Is ``token`` revoked, on its own or with all of its user's tokens?"""
+        if time.monotonic() >= self._next_refresh:
+            self.refresh()
+        if token.jti in self._revoked:
+            return True
+        user_revoked = self._revoked.get(user_jti(token.user_id))
+        # Issue times are whole milliseconds: a token issued in the same
+        # millisecond as the revocation (e.g. at the login that follows a
+        # password change) stays valid.
+        return user_revoked is not None and to_millis(token.issued_at) < to_millis(user_revoked[0])
+
+    def refresh(self):
+        now = timezone.now()
+        rows = RevokedToken.objects.filter(expires_at__gt=now)
+        if self._synced_at is not None:
+            # Overlap the previous sync to pick up rows committed late.
+            rows = rows.filter(revoked_at__gte=self._synced_at - timedelta(minutes=1))
+        rows = list(rows.values_list('jti', 'revoked_at', 'expires_at'))
+
+        with self._lock:
+            self._revoked.update((jti, (revoked_at, expires_at)) for jti, revoked_at, expires_at in rows)
+            self._revoked = {
+                jti: times for jti, times in self._revoked.items() if times[1] > now
+            }
+            self._synced_at = now
+            self._next_refresh = time.monotonic() + settings.SIGNED_TOKEN_REVOCATION_REFRESH
+
+    def revoke(self, token):
+        RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        row, _ = RevokedToken.objects.get_or_create(jti=token.jti, defaults={'expires_at': token.expires_at})
+        with self._lock:
+            self._revoked[token.jti] = (row.revoked_at, token.expires_at)
+
+    def revoke_user(self, user_id):
+        """Revoke every token issued to ``user_id`` until now."""
+        now = timezone.now()
+        row, _ = RevokedToken.objects.update_or_create(jti=user_jti(user_id), defaults={
+            'revoked_at': now,
+            'expires_at': now + timedelta(seconds=settings.SIGNED_TOKEN_MAX_AGE),
+        })
+        with self._lock:
+            self._revoked[row.jti] = (row.revoked_at, row.expires_at)
+
+
+revocations = RevocationList()
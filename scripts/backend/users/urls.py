@@ -1,10 +1,12 @@
 """URL configuration for users API."""
 from django.urls import path
-from .views import register, login, logout, me
+from .views import register, login, logout, me, hashing_stats, import_cohort_roster
 
 urlpatterns = [
     path('register/', register, name='register'),
     path('login/', login, name='login'),
     path('logout/', logout, name='logout'),
     path('me/', me, name='me'),
+    path('hashing-stats/', hashing_stats, name='hashing-stats'),
+    path('cohorts/import/', import_cohort_roster, name='import-cohort'),
 ]
@@ -2,10 +2,16 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from bfpa_backend.fieldsets import sparse_queryset
+from .cohorts import import_cohort, read_roster, roster_format
+from .hashing import hashing_pool
+from .models import UserProfile
 from .serializers import RegisterSerializer, LoginSerializer, UserSerializer
+from .tokens import SignedToken, issue_token, revocations
 
 
 @api_view(['POST'])
@@ -15,10 +21,9 @@ def register(request):
     serializer = RegisterSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.save()
-        token, _ = Token.objects.get_or_create(user=user)
         return Response({
-            'user': UserSerializer(user).data,
-            'token': token.key
+            'user': UserSerializer(user, context={'request': request}).data,
+            'token': issue_token(user)
         }, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -29,15 +34,15 @@ def login(request):
     """Login user and return token."""
     serializer = LoginSerializer(data=request.data)
     if serializer.is_valid():
-        user = authenticate(
+        user = hashing_pool.run(
+            authenticate,
             username=serializer.validated_data['username'],
             password=serializer.validated_data['password']
         )
         if user:
-            token, _ = Token.objects.get_or_create(user=user)
             return Response({
-                'user': UserSerializer(user).data,
-                'token': token.key
+                'user': UserSerializer(user, context={'request': request}).data,
+                'token': issue_token(user)
             })
         return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -46,8 +51,11 @@ def login(request):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def logout(request):
-    """Logout user by deleting token."""
-    request.user.auth_token.delete()
+    """Logout user by revoking a signed token or deleting a legacy token."""
+    if isinstance(request.auth, SignedToken):
+        revocations.revoke(request.auth)
+    else:
+        Token.objects.filter(user=request.user).delete()
     return Response({'message': 'Logged out successfully'})
 
 
@@ -55,4 +63,48 @@ def logout(request):
 @permission_classes([IsAuthenticated])
 def me(request):
     """Get current user info."""
-    return Response(UserSerializer(request.user).data)
+    serializer = UserSerializer(context={'request': request})
+    user = sparse_queryset(User.objects.select_related('profile'), serializer).get(pk=request.user.pk)
+    return Response(UserSerializer(user, context={'request': request}).data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def hashing_stats(request):
+    """Get password hashing pool load and queue depth."""
+    return Response(hashing_pool.stats())
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def import_cohort_roster(request):
+    """Create users and profiles from an uploaded roster (see users.cohorts).
+
+    Takes the roster as the request body (``text/csv``,
+    ``application/x-ndjson`` or ``application/json``) or as a multipart
+    ``file``. ``?role=`` and ``?organization=`` fill in rows without them.
+    Returns counts and the errors of every rejected row; a roster that
+    cannot be read part way through gets a 400 with the rows imported so far.
+    """
+    if request.content_type.startswith('multipart/form-data'):
+        stream = request.FILES.get('file')
+        if stream is None:
+            return Response({'error': 'file required'}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = roster_format(stream.name) or roster_format(stream.content_type or '')
+    else:
+        stream = request.stream
+        fmt = roster_format(request.content_type)
+        if stream is None:
+            return Response({'error': 'roster required'}, status=status.HTTP_400_BAD_REQUEST)
+    if fmt is None:
+        return Response(
+            {'error': 'roster must be CSV, JSON Lines or JSON'}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        )
+
+    role = request.query_params.get('role', 'student')
+    if role not in dict(UserProfile.ROLE_CHOICES):
+        return Response({'error': 'role must be one of the profile roles'}, status=status.HTTP_400_BAD_REQUEST)
+    report = import_cohort(
+        read_roster(stream, fmt), role=role, organization=request.query_params.get('organization', '')
+    )
+    return Response(report, status=status.HTTP_400_BAD_REQUEST if 'error' in report else status.HTTP_200_OK)